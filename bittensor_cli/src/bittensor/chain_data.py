@@ -1,15 +1,18 @@
 from abc import abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, Any, Union
 
 import netaddr
+import numpy as np
 from scalecodec.utils.ss58 import ss58_encode
 
 from bittensor_cli.src.bittensor.balances import Balance, fixed_to_float
 from bittensor_cli.src.bittensor.networking import int_to_ip
 from bittensor_cli.src.bittensor.utils import (
     SS58_FORMAT,
+    U16_MAX,
     u16_normalized_float as u16tf,
     u64_normalized_float as u64tf,
     decode_account_id,
@@ -63,6 +66,32 @@ def _tbwu(val: int, netuid: Optional[int] = 0) -> Balance:
     return Balance.from_rao(val).set_unit(netuid)
 
 
+def _u16tf_list(values: list[int]) -> list[float]:
+    """Normalizes a list of u16 ints to floats in a single vectorised pass."""
+    return (np.asarray(values, dtype=np.float64) / float(U16_MAX)).tolist()
+
+
+class _BalanceView(Sequence):
+    """Read-only sequence over a rao column, boxing items into Balance on access."""
+
+    __slots__ = ("_rao", "_netuid")
+
+    def __init__(self, rao: np.ndarray, netuid: int):
+        self._rao = rao
+        self._netuid = netuid
+
+    def __len__(self) -> int:
+        return len(self._rao)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [
+                Balance.from_rao(val).set_unit(self._netuid)
+                for val in self._rao[idx].tolist()
+            ]
+        return Balance.from_rao(self._rao[idx]).set_unit(self._netuid)
+
+
 def _chr_str(codes: tuple[int]) -> str:
     """Converts a tuple of integer Unicode code points into a string."""
     return "".join(map(chr, codes))
@@ -907,18 +936,34 @@ class SubnetState(InfoBase):
     validator_permit: list[bool]
     pruning_score: list[float]
     last_update: list[int]
-    emission: list[Balance]
+    emission_rao: np.ndarray
     dividends: list[float]
     incentives: list[float]
     consensus: list[float]
     trust: list[float]
     rank: list[float]
     block_at_registration: list[int]
-    alpha_stake: list[Balance]
-    tao_stake: list[Balance]
-    total_stake: list[Balance]
+    alpha_stake_rao: np.ndarray
+    tao_stake_rao: np.ndarray
+    total_stake_rao: np.ndarray
     emission_history: list[list[int]]
 
+    @property
+    def emission(self) -> _BalanceView:
+        return _BalanceView(self.emission_rao, self.netuid)
+
+    @property
+    def alpha_stake(self) -> _BalanceView:
+        return _BalanceView(self.alpha_stake_rao, self.netuid)
+
+    @property
+    def tao_stake(self) -> _BalanceView:
+        return _BalanceView(self.tao_stake_rao, 0)
+
+    @property
+    def total_stake(self) -> _BalanceView:
+        return _BalanceView(self.total_stake_rao, self.netuid)
+
     @classmethod
     def _fix_decoded(cls, decoded: Any) -> "SubnetState":
         netuid = decoded.get("netuid")
@@ -928,29 +973,18 @@ class SubnetState(InfoBase):
             coldkeys=[decode_account_id(val) for val in decoded.get("coldkeys")],
             active=decoded.get("active"),
             validator_permit=decoded.get("validator_permit"),
-            pruning_score=[u16tf(val) for val in decoded.get("pruning_score")],
+            pruning_score=_u16tf_list(decoded.get("pruning_score")),
             last_update=decoded.get("last_update"),
-            emission=[
-                Balance.from_rao(val).set_unit(netuid)
-                for val in decoded.get("emission")
-            ],
-            dividends=[u16tf(val) for val in decoded.get("dividends")],
-            incentives=[u16tf(val) for val in decoded.get("incentives")],
-            consensus=[u16tf(val) for val in decoded.get("consensus")],
-            trust=[u16tf(val) for val in decoded.get("trust")],
-            rank=[u16tf(val) for val in decoded.get("rank")],
+            emission_rao=np.asarray(decoded.get("emission"), dtype=np.int64),
+            dividends=_u16tf_list(decoded.get("dividends")),
+            incentives=_u16tf_list(decoded.get("incentives")),
+            consensus=_u16tf_list(decoded.get("consensus")),
+            trust=_u16tf_list(decoded.get("trust")),
+            rank=_u16tf_list(decoded.get("rank")),
             block_at_registration=decoded.get("block_at_registration"),
-            alpha_stake=[
-                Balance.from_rao(val).set_unit(netuid)
-                for val in decoded.get("alpha_stake")
-            ],
-            tao_stake=[
-                Balance.from_rao(val).set_unit(0) for val in decoded.get("tao_stake")
-            ],
-            total_stake=[
-                Balance.from_rao(val).set_unit(netuid)
-                for val in decoded.get("total_stake")
-            ],
+            alpha_stake_rao=np.asarray(decoded.get("alpha_stake"), dtype=np.int64),
+            tao_stake_rao=np.asarray(decoded.get("tao_stake"), dtype=np.int64),
+            total_stake_rao=np.asarray(decoded.get("total_stake"), dtype=np.int64),
             emission_history=decoded.get("emission_history"),
         )
 
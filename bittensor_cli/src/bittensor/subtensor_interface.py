@@ -114,6 +114,9 @@ class SubtensorInterface:
             type_registry=TYPE_REGISTRY,
             chain_name="Bittensor",
         )
+        # Decoded subnet states keyed by (netuid, block_hash); only pinned
+        # blocks are cached, as their state can no longer change
+        self._subnet_state_cache: dict[tuple[int, str], Optional["SubnetState"]] = {}
 
     def __str__(self):
         return f"Network: {self.network}, Chain: {self.chain_endpoint}"
@@ -593,6 +596,10 @@ class SubtensorInterface:
 
         :return: SubnetState object containing the subnet's state information, or None if the subnet doesn't exist.
         """
+        cache_key = (netuid, block_hash)
+        if block_hash is not None and cache_key in self._subnet_state_cache:
+            return self._subnet_state_cache[cache_key]
+
         result = await self.query_runtime_api(
             runtime_api="SubnetInfoRuntimeApi",
             method="get_subnet_state",
@@ -600,10 +607,16 @@ class SubtensorInterface:
             block_hash=block_hash,
         )
 
-        if result is None:
-            return None
-
-        return SubnetState.from_any(result)
+        # Building the per-UID lists is pure Python work; keep it off the event
+        # loop so concurrent queries keep being serviced meanwhile
+        subnet_state = (
+            None
+            if result is None
+            else await asyncio.to_thread(SubnetState.from_any, result)
+        )
+        if block_hash is not None:
+            self._subnet_state_cache[cache_key] = subnet_state
+        return subnet_state
 
     async def get_hyperparameter(
         self,
@@ -1599,3 +1612,34 @@ class SubtensorInterface:
         current_sqrt_price = fixed_to_float(current_sqrt_price)
         current_price = current_sqrt_price * current_sqrt_price
         return Balance.from_rao(int(current_price * 1e9))
+
+    async def get_subnet_prices(
+        self,
+        *netuids: int,
+        block_hash: Optional[str] = None,
+    ) -> dict[int, Balance]:
+        """
+        Retrieves the current prices of the given subnets in a single storage query
+        :param netuids: the netuids of the subnets
+        :param block_hash: the block hash, optional
+        :return: dict of {netuid: price}, without the subnets that have no stored price
+        """
+        if not block_hash:
+            block_hash = await self.substrate.get_chain_head()
+        calls = [
+            (
+                await self.substrate.create_storage_key(
+                    "Swap", "AlphaSqrtPrice", [netuid], block_hash=block_hash
+                )
+            )
+            for netuid in netuids
+        ]
+        batch_call = await self.substrate.query_multi(calls, block_hash=block_hash)
+        results = {}
+        for item in batch_call:
+            if not item[1]:
+                continue
+            current_sqrt_price = fixed_to_float(item[1])
+            current_price = current_sqrt_price * current_sqrt_price
+            results[item[0].params[0]] = Balance.from_rao(int(current_price * 1e9))
+        return results
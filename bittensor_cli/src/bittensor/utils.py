@@ -5,7 +5,7 @@ import os
 import sqlite3
 import webbrowser
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Collection, Optional, Union, Callable
+from typing import TYPE_CHECKING, Any, Collection, Optional, Sequence, Union, Callable
 from urllib.parse import urlparse
 from functools import partial
 import re
@@ -89,6 +89,9 @@ def print_console(message: str, colour: str, title: str, console_: Console):
 
 def print_verbose(message: str, status=None):
     """Print verbose messages while temporarily pausing the status spinner."""
+    if verbose_console.quiet:
+        # Nothing would be printed, so don't pause and redraw the spinner either
+        return
     if status:
         status.stop()
         print_console(message, "green", "Verbose", verbose_console)
@@ -249,7 +252,10 @@ def convert_root_weight_uids_and_vals_to_tensor(
 
 
 def get_hotkey_wallets_for_wallet(
-    wallet: Wallet, show_nulls: bool = False, show_encrypted: bool = False
+    wallet: Wallet,
+    show_nulls: bool = False,
+    show_encrypted: bool = False,
+    exclude: Optional[Collection[str]] = None,
 ) -> list[Optional[Wallet]]:
     """
     Returns wallet objects with hotkeys for a single given wallet
@@ -257,6 +263,7 @@ def get_hotkey_wallets_for_wallet(
     :param wallet: Wallet object to use for the path
     :param show_nulls: will add `None` into the output if a hotkey is encrypted or not on the device
     :param show_encrypted: will add some basic info about the encrypted hotkey
+    :param exclude: hotkey names to skip without loading their key files
 
     :return: a list of wallets (with Nones included for cases of a hotkey being encrypted or not on the device, if
              `show_nulls` is set to `True`)
@@ -269,6 +276,8 @@ def get_hotkey_wallets_for_wallet(
     except FileNotFoundError:
         hotkeys = []
     for h_name in hotkeys:
+        if exclude and h_name in exclude:
+            continue
         hotkey_for_name = Wallet(path=str(wallet_path), name=wallet.name, hotkey=h_name)
         try:
             if (
@@ -795,6 +804,8 @@ class DB:
     def __enter__(self):
         self.conn = sqlite3.connect(self.db_path)
         self.conn.row_factory = self.row_factory
+        # This is a disposable cache, so skip the extra fsyncs of the default FULL sync
+        self.conn.execute("PRAGMA synchronous=NORMAL")
         return self.conn, self.conn.cursor()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -802,13 +813,20 @@ class DB:
             self.conn.close()
 
 
-def create_table(title: str, columns: list[tuple[str, str]], rows: list[list]) -> None:
+def create_table(
+    title: str,
+    columns: list[tuple[str, str]],
+    rows: list[Sequence],
+    without_rowid: bool = False,
+) -> None:
     """
     Creates and populates the rows of a table in the SQLite database.
 
     :param title: title of the table
     :param columns: [(column name, column type), ...]
-    :param rows: [[element, element, ...], ...]
+    :param rows: [(element, element, ...), ...]
+    :param without_rowid: create the table as a WITHOUT ROWID table, stored directly in order of its
+                          primary key (one of the columns must then be declared PRIMARY KEY)
     :return: None
     """
     blob_cols = []
@@ -816,18 +834,20 @@ def create_table(title: str, columns: list[tuple[str, str]], rows: list[list]) -
         if col_type == "BLOB":
             blob_cols.append(idx)
     if blob_cols:
+        rows = [list(row) for row in rows]
         for row in rows:
             for idx in blob_cols:
                 row[idx] = row[idx].to_bytes(row[idx].bit_length() + 7, byteorder="big")
     with DB() as (conn, cursor):
+        # Drop, recreate and populate the table in a single transaction
+        cursor.execute("BEGIN")
         drop_query = f"DROP TABLE IF EXISTS {title}"
         cursor.execute(drop_query)
-        conn.commit()
         columns_ = ", ".join([" ".join(x) for x in columns])
         creation_query = f"CREATE TABLE IF NOT EXISTS {title} ({columns_})"
-        conn.commit()
+        if without_rowid:
+            creation_query += " WITHOUT ROWID"
         cursor.execute(creation_query)
-        conn.commit()
         query = f"INSERT INTO {title} ({', '.join([x[0] for x in columns])}) VALUES ({', '.join(['?'] * len(columns))})"
         cursor.executemany(query, rows)
         conn.commit()
@@ -869,22 +889,21 @@ def update_metadata_table(table_name: str, values: dict[str, str]) -> None:
     :return: None
     """
     with DB() as (conn, cursor):
+        cursor.execute("BEGIN")
         cursor.execute(
             "CREATE TABLE IF NOT EXISTS metadata (TableName TEXT, Key TEXT, Value TEXT)"
         )
-        conn.commit()
         for key, value in values.items():
             cursor.execute(
                 "UPDATE metadata SET Value = ? WHERE Key = ? AND TableName = ?",
                 (value, key, table_name),
             )
-            conn.commit()
             if cursor.rowcount == 0:
                 cursor.execute(
                     "INSERT INTO metadata (TableName, Key, Value) VALUES (?, ?, ?)",
                     (table_name, key, value),
                 )
-                conn.commit()
+        conn.commit()
     return
 
 
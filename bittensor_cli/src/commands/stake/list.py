@@ -1,6 +1,8 @@
 import asyncio
 import json
 from collections import defaultdict
+from contextlib import suppress
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional
 
 from bittensor_wallet import Wallet
@@ -25,6 +27,28 @@ from bittensor_cli.src.bittensor.utils import (
 if TYPE_CHECKING:
     from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
 
+# Markup tags used in every table row
+_SLIPPAGE_OPEN = f"[{COLOR_PALETTE['STAKE']['SLIPPAGE_PERCENT']}]"
+_SLIPPAGE_CLOSE = f"[/{COLOR_PALETTE['STAKE']['SLIPPAGE_PERCENT']}]"
+_NOT_REGISTERED_OPEN = f"[{COLOR_PALETTE['STAKE']['NOT_REGISTERED']}]"
+_NOT_REGISTERED_CLOSE = f"[/{COLOR_PALETTE['STAKE']['NOT_REGISTERED']}]"
+_SYMBOL_OPEN = f"[{COLOR_PALETTE['GENERAL']['SYMBOL']}]"
+_SYMBOL_CLOSE = f"[/{COLOR_PALETTE['GENERAL']['SYMBOL']}]"
+# Row-independent cells
+_ZERO_SLIPPAGE_CELL = f"{_SLIPPAGE_OPEN}0.000%{_SLIPPAGE_CLOSE}"
+_NOT_APPLICABLE_CELL = f"{_NOT_REGISTERED_OPEN}N/A{_NOT_REGISTERED_CLOSE}"
+_NOT_REGISTERED_CELL = f"{_NOT_REGISTERED_OPEN}NO"
+_ROOT_NAME_PREFIX = f"{_SYMBOL_OPEN}τ{_SYMBOL_CLOSE}"
+
+
+# Positions of the values stored per netuid for delta tracking in the live view
+_STAKE, _PRICE, _TAO_VALUE, _SWAPPED_VALUE, _EMISSION, _TAO_EMISSION = range(6)
+
+
+@lru_cache(maxsize=512)
+def _subnet_symbol(netuid: int) -> str:
+    return f"{Balance.get_unit(netuid)}\u200e"
+
 
 async def stake_list(
     wallet: Wallet,
@@ -37,17 +61,26 @@ async def stake_list(
 ):
     coldkey_address = coldkey_ss58 if coldkey_ss58 else wallet.coldkeypub.ss58_address
 
-    async def get_stake_data(block_hash_: str = None):
-        (
-            sub_stakes_,
-            registered_delegate_info_,
-            _dynamic_info,
-        ) = await asyncio.gather(
+    async def get_stake_data(
+        block_hash_: str = None, cached_delegate_info: Optional[dict] = None
+    ):
+        """
+        Fetches the coldkey's stakes, the delegate identities and the subnets' dynamic info. If
+        `cached_delegate_info` is supplied, it is reused instead of re-fetching the delegate identities.
+        """
+        calls = [
             subtensor.get_stake_for_coldkey(
                 coldkey_ss58=coldkey_address, block_hash=block_hash_
             ),
-            subtensor.get_delegate_identities(block_hash=block_hash_),
             subtensor.all_subnets(block_hash=block_hash_),
+        ]
+        if cached_delegate_info is None:
+            calls.append(subtensor.get_delegate_identities(block_hash=block_hash_))
+        sub_stakes_, _dynamic_info, *fetched_delegate_info = await asyncio.gather(
+            *calls
+        )
+        registered_delegate_info_ = (
+            fetched_delegate_info[0] if fetched_delegate_info else cached_delegate_info
         )
         # sub_stakes = substakes[coldkey_address]
         dynamic_info__ = {info.netuid: info for info in _dynamic_info}
@@ -137,6 +170,22 @@ async def stake_list(
         )
         return defined_table
 
+    def sort_substakes(
+        substakes: list[StakeInfo], dynamic_info_: dict
+    ) -> list[tuple[StakeInfo, Balance, Balance]]:
+        """
+        Orders substakes with root first, followed by the other subnets by descending TAO value. Each substake is
+        returned alongside its alpha balance and TAO value so these are only computed once per substake.
+        """
+        root_stakes, other_stakes = [], []
+        for s in substakes:
+            alpha = Balance(s.stake.rao).set_unit(s.netuid)
+            (root_stakes if s.netuid == 0 else other_stakes).append(
+                (s, alpha, dynamic_info_[s.netuid].alpha_to_tao(alpha))
+            )
+        other_stakes.sort(key=lambda x: x[2].tao, reverse=True)
+        return root_stakes + other_stakes
+
     def create_table(hotkey_: str, substakes: list[StakeInfo]):
         name_ = (
             f"{registered_delegate_info[hotkey_].display} ({hotkey_})"
@@ -144,44 +193,39 @@ async def stake_list(
             else hotkey_
         )
         rows = []
-        total_tao_value_ = Balance(0)
-        total_swapped_tao_value_ = Balance(0)
-        root_stakes = [s for s in substakes if s.netuid == 0]
-        other_stakes = sorted(
-            [s for s in substakes if s.netuid != 0],
-            key=lambda x: dynamic_info[x.netuid]
-            .alpha_to_tao(Balance.from_rao(int(x.stake.rao)).set_unit(x.netuid))
-            .tao,
-            reverse=True,
-        )
-        sorted_substakes = root_stakes + other_stakes
+        total_tao_value_rao = 0
+        total_swapped_tao_value_rao = 0
         substakes_values = []
-        for substake_ in sorted_substakes:
+        for substake_, alpha_value, tao_value_ in sort_substakes(
+            substakes, dynamic_info
+        ):
             netuid = substake_.netuid
             pool = dynamic_info[netuid]
-            symbol = f"{Balance.get_unit(netuid)}\u200e"
-
-            # Alpha value cell
-            alpha_value = Balance.from_rao(int(substake_.stake.rao)).set_unit(netuid)
+            # Skip dust stakes before doing any of the heavier per-row work
+            if alpha_value.tao <= 0.00009:
+                continue
+            symbol = _subnet_symbol(netuid)
+            price = pool.price.tao
 
             # TAO value cell
-            tao_value_ = pool.alpha_to_tao(alpha_value)
-            total_tao_value_ += tao_value_
+            total_tao_value_rao += tao_value_.rao
 
             # Swapped TAO value and slippage cell
             swapped_tao_value_, _, slippage_percentage_ = (
                 pool.alpha_to_tao_with_slippage(substake_.stake)
             )
-            total_swapped_tao_value_ += swapped_tao_value_
+            total_swapped_tao_value_rao += swapped_tao_value_.rao
 
             # Slippage percentage cell
             if pool.is_dynamic:
-                slippage_percentage = f"[{COLOR_PALETTE['STAKE']['SLIPPAGE_PERCENT']}]{slippage_percentage_:.3f}%[/{COLOR_PALETTE['STAKE']['SLIPPAGE_PERCENT']}]"
+                slippage_percentage = (
+                    f"{_SLIPPAGE_OPEN}{slippage_percentage_:.3f}%{_SLIPPAGE_CLOSE}"
+                )
             else:
-                slippage_percentage = f"[{COLOR_PALETTE['STAKE']['SLIPPAGE_PERCENT']}]0.000%[/{COLOR_PALETTE['STAKE']['SLIPPAGE_PERCENT']}]"
+                slippage_percentage = _ZERO_SLIPPAGE_CELL
 
             if netuid == 0:
-                swap_value = f"[{COLOR_PALETTE['STAKE']['NOT_REGISTERED']}]N/A[/{COLOR_PALETTE['STAKE']['NOT_REGISTERED']}] ({slippage_percentage})"
+                swap_value = f"{_NOT_APPLICABLE_CELL} ({slippage_percentage})"
             else:
                 swap_value = (
                     f"τ {millify_tao(swapped_tao_value_.tao)} ({slippage_percentage})"
@@ -190,63 +234,73 @@ async def stake_list(
                 )
 
             # Per block emission cell
-            per_block_emission = substake_.emission.tao / (pool.tempo or 1)
-            per_block_tao_emission = substake_.tao_emission.tao / (pool.tempo or 1)
-            # Alpha ownership and TAO ownership cells
-            if alpha_value.tao > 0.00009:
-                stake_value = (
-                    millify_tao(substake_.stake.tao)
+            tempo = pool.tempo or 1
+            per_block_emission = substake_.emission.tao / tempo
+            per_block_tao_emission = substake_.tao_emission.tao / tempo
+            stake_value = (
+                millify_tao(substake_.stake.tao)
+                if not verbose
+                else f"{substake_.stake.tao:,.4f}"
+            )
+            subnet_name = subnet_names[netuid]
+            name_prefix = (
+                f"{_SYMBOL_OPEN}{symbol}{_SYMBOL_CLOSE}"
+                if netuid != 0
+                else _ROOT_NAME_PREFIX
+            )
+            subnet_name_cell = f"{name_prefix} {subnet_name}"
+
+            rows.append(
+                [
+                    str(netuid),  # Number
+                    subnet_name_cell,  # Symbol + name
+                    f"τ {millify_tao(tao_value_.tao)}"
                     if not verbose
-                    else f"{substake_.stake.tao:,.4f}"
-                )
-                subnet_name = get_subnet_name(dynamic_info[netuid])
-                subnet_name_cell = f"[{COLOR_PALETTE['GENERAL']['SYMBOL']}]{symbol if netuid != 0 else 'τ'}[/{COLOR_PALETTE['GENERAL']['SYMBOL']}] {subnet_name}"
-
-                rows.append(
-                    [
-                        str(netuid),  # Number
-                        subnet_name_cell,  # Symbol + name
-                        f"τ {millify_tao(tao_value_.tao)}"
-                        if not verbose
-                        else f"{tao_value_}",  # Value (α x τ/α)
-                        f"{stake_value} {symbol}"
-                        if netuid != 0
-                        else f"{symbol} {stake_value}",  # Stake (a)
-                        f"{pool.price.tao:.4f} τ/{symbol}",  # Rate (t/a)
-                        # f"τ {millify_tao(tao_ownership.tao)}" if not verbose else f"{tao_ownership}",  # TAO equiv
-                        swap_value,  # Swap(α) -> τ
-                        "YES"
-                        if substake_.is_registered
-                        else f"[{COLOR_PALETTE['STAKE']['NOT_REGISTERED']}]NO",  # Registered
-                        str(Balance.from_tao(per_block_emission).set_unit(netuid)),
-                        # Removing this flag for now, TODO: Confirm correct values are here w.r.t CHKs
-                        # if substake_.is_registered
-                        # else f"[{COLOR_PALETTE['STAKE']['NOT_REGISTERED']}]N/A",  # Emission(α/block)
-                        str(Balance.from_tao(per_block_tao_emission)),
-                    ]
-                )
-                substakes_values.append(
-                    {
-                        "netuid": netuid,
-                        "subnet_name": subnet_name,
-                        "value": tao_value_.tao,
-                        "stake_value": substake_.stake.tao,
-                        "rate": pool.price.tao,
-                        "swap_value": swap_value,
-                        "registered": True if substake_.is_registered else False,
-                        "emission": {
-                            "alpha": per_block_emission,
-                            "tao": per_block_tao_emission,
-                        },
-                    }
-                )
+                    else f"{tao_value_}",  # Value (α x τ/α)
+                    f"{stake_value} {symbol}"
+                    if netuid != 0
+                    else f"{symbol} {stake_value}",  # Stake (a)
+                    f"{price:.4f} τ/{symbol}",  # Rate (t/a)
+                    # f"τ {millify_tao(tao_ownership.tao)}" if not verbose else f"{tao_ownership}",  # TAO equiv
+                    swap_value,  # Swap(α) -> τ
+                    "YES"
+                    if substake_.is_registered
+                    else _NOT_REGISTERED_CELL,  # Registered
+                    str(Balance.from_tao(per_block_emission).set_unit(netuid)),
+                    # Removing this flag for now, TODO: Confirm correct values are here w.r.t CHKs
+                    # if substake_.is_registered
+                    # else f"[{COLOR_PALETTE['STAKE']['NOT_REGISTERED']}]N/A",  # Emission(α/block)
+                    str(Balance.from_tao(per_block_tao_emission)),
+                ]
+            )
+            substakes_values.append(
+                {
+                    "netuid": netuid,
+                    "subnet_name": subnet_name,
+                    "value": tao_value_.tao,
+                    "stake_value": substake_.stake.tao,
+                    "rate": price,
+                    "swap_value": swap_value,
+                    "registered": True if substake_.is_registered else False,
+                    "emission": {
+                        "alpha": per_block_emission,
+                        "tao": per_block_tao_emission,
+                    },
+                }
+            )
+        total_tao_value_ = Balance.from_rao(total_tao_value_rao)
+        total_swapped_tao_value_ = Balance.from_rao(total_swapped_tao_value_rao)
         created_table = define_table(
             name_, rows, total_tao_value_, total_swapped_tao_value_
         )
         for row in rows:
             created_table.add_row(*row)
-        console.print(created_table)
-        return total_tao_value_, total_swapped_tao_value_, substakes_values
+        return (
+            created_table,
+            total_tao_value_,
+            total_swapped_tao_value_,
+            substakes_values,
+        )
 
     def create_live_table(
         substakes: list,
@@ -257,8 +311,8 @@ async def stake_list(
         rows = []
         current_data_ = {}
 
-        total_tao_value_ = Balance(0)
-        total_swapped_tao_value_ = Balance(0)
+        total_tao_value_rao = 0
+        total_swapped_tao_value_rao = 0
 
         def format_cell(
             value,
@@ -294,51 +348,45 @@ async def stake_list(
                 else f"{unit} {formatted_value}{change_text}"
             )
 
-        # Sort subnets by value
-        root_stakes = [s for s in substakes if s.netuid == 0]
-        other_stakes = sorted(
-            [s for s in substakes if s.netuid != 0],
-            key=lambda x: dynamic_info_for_lt[x.netuid]
-            .alpha_to_tao(Balance.from_rao(int(x.stake.rao)).set_unit(x.netuid))
-            .tao,
-            reverse=True,
-        )
-        sorted_substakes = root_stakes + other_stakes
-
-        # Process each stake
-        for substake_ in sorted_substakes:
+        # Process each stake, sorted by value
+        for substake_, alpha_value, tao_value_ in sort_substakes(
+            substakes, dynamic_info_for_lt
+        ):
             netuid = substake_.netuid
             pool = dynamic_info_for_lt.get(netuid)
             if substake_.stake.rao == 0 or not pool:
                 continue
 
             # Calculate base values
-            symbol = f"{Balance.get_unit(netuid)}\u200e"
-            alpha_value = Balance.from_rao(int(substake_.stake.rao)).set_unit(netuid)
-            tao_value_ = pool.alpha_to_tao(alpha_value)
-            total_tao_value_ += tao_value_
+            symbol = _subnet_symbol(netuid)
+            total_tao_value_rao += tao_value_.rao
             swapped_tao_value_, slippage, slippage_pct = (
                 pool.alpha_to_tao_with_slippage(substake_.stake)
             )
-            total_swapped_tao_value_ += swapped_tao_value_
+            total_swapped_tao_value_rao += swapped_tao_value_.rao
+
+            price = pool.price.tao
+            tempo = pool.tempo or 1
+            emission_value = substake_.emission.tao / tempo
+            tao_emission_value = substake_.tao_emission.tao / tempo
 
             # Store current values for future delta tracking
-            current_data_[netuid] = {
-                "stake": alpha_value.tao,
-                "price": pool.price.tao,
-                "tao_value": tao_value_.tao,
-                "swapped_value": swapped_tao_value_.tao,
-                "emission": substake_.emission.tao / (pool.tempo or 1),
-                "tao_emission": substake_.tao_emission.tao / (pool.tempo or 1),
-            }
+            current_data_[netuid] = (
+                alpha_value.tao,
+                price,
+                tao_value_.tao,
+                swapped_tao_value_.tao,
+                emission_value,
+                tao_emission_value,
+            )
 
             # Get previous values for delta tracking
-            prev = previous_data_.get(netuid, {}) if previous_data_ else {}
+            prev = previous_data_.get(netuid) if previous_data_ else None
             unit_first = True if netuid == 0 else False
 
             stake_cell = format_cell(
                 alpha_value.tao,
-                prev.get("stake"),
+                prev[_STAKE] if prev else None,
                 unit=symbol,
                 unit_first_=unit_first,
                 precision=4,
@@ -346,8 +394,8 @@ async def stake_list(
             )
 
             rate_cell = format_cell(
-                pool.price.tao,
-                prev.get("price"),
+                price,
+                prev[_PRICE] if prev else None,
                 unit=f"τ/{symbol}",
                 unit_first_=False,
                 precision=5,
@@ -356,7 +404,7 @@ async def stake_list(
 
             exchange_cell = format_cell(
                 tao_value_.tao,
-                prev.get("tao_value"),
+                prev[_TAO_VALUE] if prev else None,
                 unit="τ",
                 unit_first_=True,
                 precision=4,
@@ -367,7 +415,7 @@ async def stake_list(
                 swap_cell = (
                     format_cell(
                         swapped_tao_value_.tao,
-                        prev.get("swapped_value"),
+                        prev[_SWAPPED_VALUE] if prev else None,
                         unit="τ",
                         unit_first_=True,
                         precision=4,
@@ -376,29 +424,31 @@ async def stake_list(
                     + f" ({slippage_pct:.2f}%)"
                 )
             else:
-                swap_cell = f"[{COLOR_PALETTE['STAKE']['NOT_REGISTERED']}]N/A[/{COLOR_PALETTE['STAKE']['NOT_REGISTERED']}] ({slippage_pct}%)"
+                swap_cell = f"{_NOT_APPLICABLE_CELL} ({slippage_pct}%)"
 
-            emission_value = substake_.emission.tao / (pool.tempo or 1)
             emission_cell = format_cell(
                 emission_value,
-                prev.get("emission"),
+                prev[_EMISSION] if prev else None,
                 unit=symbol,
                 unit_first_=unit_first,
                 precision=4,
             )
 
-            tao_emission_value = substake_.tao_emission.tao / (pool.tempo or 1)
             tao_emission_cell = format_cell(
                 tao_emission_value,
-                prev.get("tao_emission"),
+                prev[_TAO_EMISSION] if prev else None,
                 unit="τ",
                 unit_first_=unit_first,
                 precision=4,
             )
 
+            name_prefix = (
+                f"{_SYMBOL_OPEN}{symbol}{_SYMBOL_CLOSE}"
+                if netuid != 0
+                else _ROOT_NAME_PREFIX
+            )
             subnet_name_cell = (
-                f"[{COLOR_PALETTE['GENERAL']['SYMBOL']}]{symbol if netuid != 0 else 'τ'}[/{COLOR_PALETTE['GENERAL']['SYMBOL']}]"
-                f" {get_subnet_name(dynamic_info_for_lt[netuid])}"
+                f"{name_prefix} {get_subnet_name(dynamic_info_for_lt[netuid])}"
             )
 
             rows.append(
@@ -411,14 +461,17 @@ async def stake_list(
                     swap_cell,  # Swap value with slippage
                     "YES"
                     if substake_.is_registered
-                    else f"[{COLOR_PALETTE['STAKE']['NOT_REGISTERED']}]NO",  # Registration status
+                    else _NOT_REGISTERED_CELL,  # Registration status
                     emission_cell,  # Emission rate
                     tao_emission_cell,  # TAO emission rate
                 ]
             )
 
         live_table = define_table(
-            hotkey_name_, rows, total_tao_value_, total_swapped_tao_value_
+            hotkey_name_,
+            rows,
+            Balance.from_rao(total_tao_value_rao),
+            Balance.from_rao(total_swapped_tao_value_rao),
         )
 
         for row in rows:
@@ -428,23 +481,36 @@ async def stake_list(
 
     # Main execution
     block_hash = await subtensor.substrate.get_chain_head()
-    (
+    if live:
+        # The live view fetches its own subnet data on every refresh, so only fetch
+        # what is needed to pick the hotkey to monitor
+        sub_stakes, registered_delegate_info = await asyncio.gather(
+            subtensor.get_stake_for_coldkey(
+                coldkey_ss58=coldkey_address, block_hash=block_hash
+            ),
+            subtensor.get_delegate_identities(block_hash=block_hash),
+        )
+    else:
         (
-            sub_stakes,
-            registered_delegate_info,
-            dynamic_info,
-        ),
-        balance,
-    ) = await asyncio.gather(
-        get_stake_data(block_hash),
-        subtensor.get_balance(coldkey_address, block_hash=block_hash),
-    )
+            (
+                sub_stakes,
+                registered_delegate_info,
+                dynamic_info,
+            ),
+            balance,
+        ) = await asyncio.gather(
+            get_stake_data(block_hash),
+            subtensor.get_balance(coldkey_address, block_hash=block_hash),
+        )
+        subnet_names = {
+            netuid: get_subnet_name(info) for netuid, info in dynamic_info.items()
+        }
 
     # Iterate over substakes and aggregate them by hotkey.
-    hotkeys_to_substakes: dict[str, list[StakeInfo]] = defaultdict(list)
+    hotkeys_to_substakes: defaultdict[str, list[StakeInfo]] = defaultdict(list)
 
     for substake in sub_stakes:
-        if substake.stake.rao != 0:
+        if substake.stake.rao:
             hotkeys_to_substakes[substake.hotkey_ss58].append(substake)
 
     if not hotkeys_to_substakes:
@@ -480,6 +546,9 @@ async def stake_list(
         )
 
         refresh_interval = 10  # seconds
+        # Delegate identities rarely change, so only refetch them every few refreshes
+        delegate_refresh_ticks = 6
+        tick = 1  # identities were just fetched above
         progress = Progress(
             TextColumn("[progress.description]{task.description}"),
             BarColumn(bar_width=20),
@@ -491,24 +560,49 @@ async def stake_list(
         previous_block = None
         current_block = None
         previous_data = None
+        loop = asyncio.get_event_loop()
+
+        async def fetch_live_data(refresh_delegates: bool):
+            started = loop.time()
+            block_hash_ = await subtensor.substrate.get_chain_head()
+            stake_data, block_number_ = await asyncio.gather(
+                get_stake_data(
+                    block_hash_,
+                    cached_delegate_info=None
+                    if refresh_delegates
+                    else registered_delegate_info,
+                ),
+                subtensor.substrate.get_block_number(None),
+            )
+            return stake_data, block_number_, loop.time() - started
+
+        def start_fetch() -> asyncio.Task:
+            nonlocal tick
+            refresh_delegates = tick % delegate_refresh_ticks == 0
+            tick += 1
+            return asyncio.create_task(fetch_live_data(refresh_delegates))
 
         with Live(console=console, screen=True, auto_refresh=True) as live:
+            next_fetch: Optional[asyncio.Task] = None
             try:
+                next_fetch = start_fetch()
                 while True:
-                    block_hash = await subtensor.substrate.get_chain_head()
                     (
-                        sub_stakes,
-                        registered_delegate_info,
-                        dynamic_info_,
-                    ) = await get_stake_data(block_hash)
+                        (
+                            sub_stakes,
+                            registered_delegate_info,
+                            dynamic_info_,
+                        ),
+                        block_number,
+                        fetch_duration,
+                    ) = await next_fetch
+                    next_fetch = None
                     selected_stakes = [
                         stake
                         for stake in sub_stakes
                         if stake.hotkey_ss58 == selected_hotkey
                     ]
 
-                    block_number = await subtensor.substrate.get_block_number(None)
-
                     previous_block = current_block
                     current_block = block_number
                     new_blocks = (
@@ -517,7 +611,10 @@ async def stake_list(
                         else str(current_block - previous_block)
                     )
 
-                    table, current_data = create_live_table(
+                    # Build the table off the event loop so it doesn't stall the
+                    # substrate websocket
+                    table, current_data = await asyncio.to_thread(
+                        create_live_table,
                         selected_stakes,
                         dynamic_info_,
                         hotkey_name,
@@ -526,7 +623,7 @@ async def stake_list(
 
                     previous_data = current_data
                     progress.reset(progress_task)
-                    start_time = asyncio.get_event_loop().time()
+                    start_time = loop.time()
 
                     block_info = (
                         f"Previous: [dark_sea_green]{previous_block}[/dark_sea_green] "
@@ -536,25 +633,42 @@ async def stake_list(
 
                     message = f"\nLive stake view - Press [bold red]Ctrl+C[/bold red] to exit\n{block_info}"
                     live_render = Group(message, progress, table)
-                    live.update(live_render)
+                    # Only swap the renderable here; Live's auto-refresh thread does the
+                    # actual rendering and terminal writes off the event loop
+                    live.update(live_render, refresh=False)
 
+                    # Prefetch the next frame while this one is displayed, timed so the
+                    # data lands around when the countdown finishes
                     while not progress.finished:
                         await asyncio.sleep(0.1)
-                        elapsed = asyncio.get_event_loop().time() - start_time
+                        elapsed = loop.time() - start_time
                         progress.update(
                             progress_task, completed=min(elapsed, refresh_interval)
                         )
+                        if (
+                            next_fetch is None
+                            and refresh_interval - elapsed <= fetch_duration
+                        ):
+                            next_fetch = start_fetch()
+                    if next_fetch is None:
+                        next_fetch = start_fetch()
 
             except KeyboardInterrupt:
                 console.print("\n[bold]Stopped live updates[/bold]")
                 return
+            finally:
+                # Don't leave a prefetch running while the substrate connection closes
+                if next_fetch is not None and not next_fetch.done():
+                    next_fetch.cancel()
+                    with suppress(asyncio.CancelledError):
+                        await next_fetch
 
     else:
         # Iterate over each hotkey and make a table
         counter = 0
         num_hotkeys = len(hotkeys_to_substakes)
-        all_hks_swapped_tao_value = Balance(0)
-        all_hks_tao_value = Balance(0)
+        all_hks_swapped_tao_value_rao = 0
+        all_hks_tao_value_rao = 0
         dict_output = {
             "stake_info": {},
             "coldkey_address": coldkey_address,
@@ -563,19 +677,26 @@ async def stake_list(
             "total_tao_value": 0.0,
             "total_swapped_tao_value": 0.0,
         }
-        for hotkey, substakes in hotkeys_to_substakes.items():
+        # Each hotkey's table is independent, so build them all concurrently and
+        # print each one as soon as it (and every table before it) is ready.
+        table_tasks = [
+            asyncio.create_task(asyncio.to_thread(create_table, hotkey, substakes))
+            for hotkey, substakes in hotkeys_to_substakes.items()
+        ]
+        for hotkey, table_task in zip(hotkeys_to_substakes.keys(), table_tasks):
+            table, tao_value, swapped_tao_value, substake_values_ = await table_task
             counter += 1
-            tao_value, swapped_tao_value, substake_values_ = create_table(
-                hotkey, substakes
-            )
+            console.print(table)
             dict_output["stake_info"][hotkey] = substake_values_
-            all_hks_tao_value += tao_value
-            all_hks_swapped_tao_value += swapped_tao_value
+            all_hks_tao_value_rao += tao_value.rao
+            all_hks_swapped_tao_value_rao += swapped_tao_value.rao
 
             if num_hotkeys > 1 and counter < num_hotkeys and prompt and not json_output:
                 console.print("\nPress Enter to continue to the next hotkey...")
                 input()
 
+        all_hks_tao_value = Balance.from_rao(all_hks_tao_value_rao)
+        all_hks_swapped_tao_value = Balance.from_rao(all_hks_swapped_tao_value_rao)
         total_tao_value = (
             f"τ {millify_tao(all_hks_tao_value.tao)}"
             if not verbose
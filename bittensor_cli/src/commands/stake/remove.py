@@ -1,5 +1,6 @@
 import asyncio
 import json
+from collections import defaultdict
 from functools import partial
 
 from typing import TYPE_CHECKING, Optional
@@ -7,7 +8,9 @@ from typing import TYPE_CHECKING, Optional
 from bittensor_wallet import Wallet
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
+from rich.text import Text
 
+from async_substrate_interface.async_substrate import AsyncExtrinsicReceipt
 from async_substrate_interface.errors import SubstrateRequestException
 from bittensor_cli.src import COLOR_PALETTE
 from bittensor_cli.src.bittensor.balances import Balance
@@ -27,6 +30,42 @@ from bittensor_cli.src.bittensor.utils import (
 if TYPE_CHECKING:
     from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
 
+# Palette colours and units used by the unstake tables and messages
+_C_HEADER = COLOR_PALETTE["GENERAL"]["HEADER"]
+_C_SUBHEADING = COLOR_PALETTE["GENERAL"]["SUBHEADING"]
+_C_COLDKEY = COLOR_PALETTE["GENERAL"]["COLDKEY"]
+_C_HOTKEY = COLOR_PALETTE["GENERAL"]["HOTKEY"]
+_C_NETUID = COLOR_PALETTE["GENERAL"]["NETUID"]
+_C_SYMBOL = COLOR_PALETTE["GENERAL"]["SYMBOL"]
+_C_STAKE_AMOUNT = COLOR_PALETTE["STAKE"]["STAKE_AMOUNT"]
+_C_STAKE_ALPHA = COLOR_PALETTE["STAKE"]["STAKE_ALPHA"]
+_C_SLIPPAGE_PERCENT = COLOR_PALETTE["STAKE"]["SLIPPAGE_PERCENT"]
+_C_SLIPPAGE_TEXT = COLOR_PALETTE["STAKE"]["SLIPPAGE_TEXT"]
+_C_RATE = COLOR_PALETTE["POOLS"]["RATE"]
+_C_POOLS_TAO = COLOR_PALETTE["POOLS"]["TAO"]
+_C_TAO_EQUIV = COLOR_PALETTE["POOLS"]["TAO_EQUIV"]
+_UNIT_TAO = Balance.get_unit(0)
+_UNIT_ALPHA = Balance.get_unit(1)
+
+# Printed below the unstake summary table
+_UNSTAKE_DESCRIPTION = """
+[bold white]Description[/bold white]:
+The table displays information about the stake remove operation you are about to perform.
+The columns are as follows:
+    - [bold white]Netuid[/bold white]: The netuid of the subnet you are unstaking from.
+    - [bold white]Hotkey[/bold white]: The ss58 address or identity of the hotkey you are unstaking from. 
+    - [bold white]Amount to Unstake[/bold white]: The stake amount you are removing from this key.
+    - [bold white]Rate[/bold white]: The rate of exchange between TAO and the subnet's stake.
+    - [bold white]Fee[/bold white]: The transaction fee for this unstake operation.
+    - [bold white]Received[/bold white]: The amount of free balance TAO you will receive on this subnet after slippage and fees.
+    - [bold white]Slippage[/bold white]: The slippage percentage of the unstake operation. (0% if the subnet is not dynamic i.e. root)."""
+_SAFE_UNSTAKE_DESCRIPTION = (
+    _UNSTAKE_DESCRIPTION
+    + """
+    - [bold white]Rate Tolerance[/bold white]: Maximum acceptable alpha rate. If the rate reduces below this tolerance, the transaction will be limited or rejected.
+    - [bold white]Partial unstaking[/bold white]: If True, allows unstaking up to the rate tolerance limit. If False, the entire transaction will fail if rate tolerance is exceeded.\n"""
+)
+
 
 # Commands
 async def unstake(
@@ -57,6 +96,7 @@ async def unstake(
             ck_hk_identities,
             old_identities,
             stake_infos,
+            prices,
         ) = await asyncio.gather(
             subtensor.all_subnets(block_hash=chain_head),
             subtensor.fetch_coldkey_hotkey_identities(block_hash=chain_head),
@@ -64,14 +104,13 @@ async def unstake(
             subtensor.get_stake_for_coldkey(
                 wallet.coldkeypub.ss58_address, block_hash=chain_head
             ),
+            _get_dynamic_subnet_prices(subtensor, block_hash=chain_head),
         )
-        prices = await asyncio.gather(*[
-            subtensor.get_subnet_price(netuid=netuid) for _ in all_sn_dynamic_info_
-        ])
-
-        for item, price in zip(all_sn_dynamic_info_, prices):
-            item.price = price
-            all_sn_dynamic_info = {info.netuid: info for info in all_sn_dynamic_info_}
+        all_sn_dynamic_info = {info.netuid: info for info in all_sn_dynamic_info_}
+        for netuid_, price in prices.items():
+            # Non-dynamic subnets such as root keep the price from their DynamicInfo
+            if all_sn_dynamic_info[netuid_].is_dynamic:
+                all_sn_dynamic_info[netuid_].price = price
 
     if interactive:
         try:
@@ -98,19 +137,23 @@ async def unstake(
                 hotkey_ss58_address=hotkey_to_unstake_all[1],
                 unstake_all_alpha=unstake_all_alpha,
                 prompt=prompt,
+                prefetched=(
+                    stake_infos,
+                    ck_hk_identities,
+                    old_identities,
+                    all_sn_dynamic_info_,
+                ),
             )
 
         if not hotkeys_to_unstake_from:
             console.print("[red]No unstake operations to perform.[/red]")
             return False
-        netuids = list({netuid for _, _, netuid in hotkeys_to_unstake_from})
+        netuids = list(
+            dict.fromkeys(netuid_ for _, _, netuid_ in hotkeys_to_unstake_from)
+        )
 
     else:
-        netuids = (
-            [int(netuid)]
-            if netuid is not None
-            else await subtensor.get_all_subnet_netuids()
-        )
+        netuids = [int(netuid)] if netuid is not None else list(all_sn_dynamic_info)
         hotkeys_to_unstake_from = _get_hotkeys_to_unstake(
             wallet=wallet,
             hotkey_ss58_address=hotkey_ss58_address,
@@ -122,17 +165,15 @@ async def unstake(
             old_identities=old_identities,
         )
 
-    with console.status(
-        f"Retrieving stake data from {subtensor.network}...",
-        spinner="earth",
-    ):
-        stake_in_netuids = {}
-        for stake_info in stake_infos:
-            if stake_info.hotkey_ss58 not in stake_in_netuids:
-                stake_in_netuids[stake_info.hotkey_ss58] = {}
-            stake_in_netuids[stake_info.hotkey_ss58][stake_info.netuid] = (
-                stake_info.stake
-            )
+    stake_by_key = {(s.hotkey_ss58, s.netuid): s.stake for s in stake_infos}
+    rate_units = {
+        netuid_: f"{_UNIT_TAO}/{Balance.get_unit(netuid_)}" for netuid_ in netuids
+    }
+    hotkey_netuids: defaultdict[str, set[int]] = defaultdict(set)
+    for hotkey_ss58, netuid_ in stake_by_key:
+        hotkey_netuids[hotkey_ss58].add(netuid_)
+    # When going over every subnet, only visit the ones each hotkey is staked on
+    only_staked_subnets = not interactive and netuid is None
 
     # Flag to check if user wants to quit
     skip_remaining_subnets = False
@@ -141,11 +182,11 @@ async def unstake(
             "[dark_sea_green3]Tip: Enter 'q' any time to stop going over remaining subnets and process current unstakes.\n"
         )
 
-    # Iterate over hotkeys and netuids to collect unstake operations
-    unstake_operations = []
-    total_received_amount = Balance.from_tao(0)
-    max_float_slippage = 0
-    table_rows = []
+    # Iterate over hotkeys and netuids to collect the amounts to unstake. All prompting
+    # happens here, before any of the fee queries are made.
+    selected_unstakes = []
+    # A fixed --amount only needs one Balance per subnet unit
+    fixed_amounts: dict[int, Balance] = {}
     for hotkey in hotkeys_to_unstake_from:
         if skip_remaining_subnets:
             break
@@ -157,20 +198,18 @@ async def unstake(
             staking_address_name, staking_address_ss58, _ = hotkey
             netuids_to_process = netuids
 
-        initial_amount = amount
+        staked_netuids = hotkey_netuids.get(staking_address_ss58)
+        if not staked_netuids:
+            print_error(f"No stake found for hotkey: {staking_address_ss58}")
+            continue  # Skip to next hotkey
+        if only_staked_subnets:
+            netuids_to_process = [n for n in netuids_to_process if n in staked_netuids]
 
         for netuid in netuids_to_process:
             if skip_remaining_subnets:
                 break  # Exit the loop over netuids
 
-            subnet_info = all_sn_dynamic_info.get(netuid)
-            if staking_address_ss58 not in stake_in_netuids:
-                print_error(
-                    f"No stake found for hotkey: {staking_address_ss58} on netuid: {netuid}"
-                )
-                continue  # Skip to next hotkey
-
-            current_stake_balance = stake_in_netuids[staking_address_ss58].get(netuid)
+            current_stake_balance = stake_by_key.get((staking_address_ss58, netuid))
             if current_stake_balance is None or current_stake_balance.tao == 0:
                 print_error(
                     f"No stake to unstake from {staking_address_ss58} on netuid: {netuid}"
@@ -178,8 +217,10 @@ async def unstake(
                 continue  # No stake to unstake
 
             # Determine the amount we are unstaking.
-            if initial_amount:
-                amount_to_unstake_as_balance = Balance.from_tao(initial_amount)
+            if amount:
+                if netuid not in fixed_amounts:
+                    fixed_amounts[netuid] = Balance.from_tao(amount).set_unit(netuid)
+                amount_to_unstake_as_balance = fixed_amounts[netuid]
             else:
                 amount_to_unstake_as_balance = _ask_unstake_amount(
                     current_stake_balance,
@@ -192,9 +233,9 @@ async def unstake(
                 if amount_to_unstake_as_balance is None:
                     skip_remaining_subnets = True
                     break
+                amount_to_unstake_as_balance.set_unit(netuid)
 
             # Check enough stake to remove.
-            amount_to_unstake_as_balance.set_unit(netuid)
             if amount_to_unstake_as_balance > current_stake_balance:
                 err_console.print(
                     f"[red]Not enough stake to remove[/red]:\n"
@@ -204,80 +245,117 @@ async def unstake(
                 )
                 continue  # Skip to the next subnet - useful when single amount is specified for all subnets
 
-            stake_fee = await subtensor.get_stake_fee(
-                origin_hotkey_ss58=staking_address_ss58,
-                origin_netuid=netuid,
+            selected_unstakes.append(
+                (
+                    staking_address_name,
+                    staking_address_ss58,
+                    netuid,
+                    current_stake_balance,
+                    amount_to_unstake_as_balance,
+                )
+            )
+
+    stake_fees = await asyncio.gather(
+        *[
+            subtensor.get_stake_fee(
+                origin_hotkey_ss58=hotkey_ss58,
+                origin_netuid=netuid_,
                 origin_coldkey_ss58=wallet.coldkeypub.ss58_address,
                 destination_hotkey_ss58=None,
                 destination_netuid=None,
                 destination_coldkey_ss58=wallet.coldkeypub.ss58_address,
-                amount=amount_to_unstake_as_balance.rao,
+                amount=amount_.rao,
             )
+            for _, hotkey_ss58, netuid_, _, amount_ in selected_unstakes
+        ]
+    )
 
+    unstake_operations = []
+    total_received_rao = 0
+    max_float_slippage = 0
+    table_rows = []
+    # The same amount unstaked from several hotkeys on one subnet gives the same slippage
+    slippage_cache: dict[tuple[int, int, int], tuple[Balance, str, float]] = {}
+    # Same for every row, so parse the markup once rather than per table cell
+    partial_stake_cell = Text.from_markup(
+        f"[{'dark_sea_green3' if allow_partial_stake else 'red'}]"
+        f"{allow_partial_stake}[/{'dark_sea_green3' if allow_partial_stake else 'red'}]"
+    )
+    for selected_unstake, stake_fee in zip(selected_unstakes, stake_fees):
+        (
+            staking_address_name,
+            staking_address_ss58,
+            netuid,
+            current_stake_balance,
+            amount_to_unstake_as_balance,
+        ) = selected_unstake
+        subnet_info = all_sn_dynamic_info.get(netuid)
+
+        slippage_key = (netuid, amount_to_unstake_as_balance.rao, stake_fee.rao)
+        if slippage_key not in slippage_cache:
             try:
-                received_amount, slippage_pct, slippage_pct_float = _calculate_slippage(
+                slippage_cache[slippage_key] = _calculate_slippage(
                     subnet_info=subnet_info,
                     amount=amount_to_unstake_as_balance,
                     stake_fee=stake_fee,
                 )
             except ValueError:
                 continue
+        received_amount, slippage_pct, slippage_pct_float = slippage_cache[slippage_key]
+
+        total_received_rao += received_amount.rao
+        max_float_slippage = max(max_float_slippage, slippage_pct_float)
+
+        base_unstake_op = {
+            "netuid": netuid,
+            "hotkey_name": staking_address_name
+            if staking_address_name
+            else staking_address_ss58,
+            "hotkey_ss58": staking_address_ss58,
+            "amount_to_unstake": amount_to_unstake_as_balance,
+            "current_stake_balance": current_stake_balance,
+            "received_amount": received_amount,
+            "slippage_pct": slippage_pct,
+            "slippage_pct_float": slippage_pct_float,
+            "dynamic_info": subnet_info,
+        }
+
+        base_table_row = [
+            str(netuid),  # Netuid
+            staking_address_name,  # Hotkey Name
+            str(amount_to_unstake_as_balance),  # Amount to Unstake
+            f"{subnet_info.price.tao}({rate_units[netuid]})",  # Rate
+            str(stake_fee),  # Fee
+            # str(received_amount),  # Received Amount
+            # slippage_pct,  # Slippage Percent
+        ]
 
-            total_received_amount += received_amount
-            max_float_slippage = max(max_float_slippage, slippage_pct_float)
-
-            base_unstake_op = {
-                "netuid": netuid,
-                "hotkey_name": staking_address_name
-                if staking_address_name
-                else staking_address_ss58,
-                "hotkey_ss58": staking_address_ss58,
-                "amount_to_unstake": amount_to_unstake_as_balance,
-                "current_stake_balance": current_stake_balance,
-                "received_amount": received_amount,
-                "slippage_pct": slippage_pct,
-                "slippage_pct_float": slippage_pct_float,
-                "dynamic_info": subnet_info,
-            }
-
-            base_table_row = [
-                str(netuid),  # Netuid
-                staking_address_name,  # Hotkey Name
-                str(amount_to_unstake_as_balance),  # Amount to Unstake
-                str(subnet_info.price.tao)
-                + f"({Balance.get_unit(0)}/{Balance.get_unit(netuid)})",  # Rate
-                str(stake_fee),  # Fee
-                # str(received_amount),  # Received Amount
-                # slippage_pct,  # Slippage Percent
-            ]
-
-            # Additional fields for safe unstaking
-            if safe_staking:
-                if subnet_info.is_dynamic:
-                    rate = received_amount.rao / amount_to_unstake_as_balance.rao
-                    rate_with_tolerance = rate * (
-                        1 - rate_tolerance
-                    )  # Rate only for display
-                    price_with_tolerance = Balance.from_tao(
-                        rate_with_tolerance
-                    ).rao  # Actual price to pass to extrinsic
-                else:
-                    rate_with_tolerance = 1
-                    price_with_tolerance = 1
-
-                base_unstake_op["price_with_tolerance"] = price_with_tolerance
-                base_table_row.extend(
-                    [
-                        # Rate with tolerance
-                        f"{rate_with_tolerance:.4f} {Balance.get_unit(0)}/{Balance.get_unit(netuid)}",
-                        # Partial unstake
-                        f"[{'dark_sea_green3' if allow_partial_stake else 'red'}]"
-                        f"{allow_partial_stake}[/{'dark_sea_green3' if allow_partial_stake else 'red'}]",
-                    ]
-                )
+        # Additional fields for safe unstaking
+        if safe_staking:
+            if subnet_info.is_dynamic:
+                rate = received_amount.rao / amount_to_unstake_as_balance.rao
+                rate_with_tolerance = rate * (
+                    1 - rate_tolerance
+                )  # Rate only for display
+                price_with_tolerance = Balance.from_tao(
+                    rate_with_tolerance
+                ).rao  # Actual price to pass to extrinsic
+            else:
+                rate_with_tolerance = 1
+                price_with_tolerance = 1
+
+            base_unstake_op["price_with_tolerance"] = price_with_tolerance
+            base_table_row.extend(
+                [
+                    # Rate with tolerance
+                    f"{rate_with_tolerance:.4f} {rate_units[netuid]}",
+                    # Partial unstake
+                    partial_stake_cell,
+                ]
+            )
 
-            unstake_operations.append(base_unstake_op)
-            table_rows.append(base_table_row)
+        unstake_operations.append(base_unstake_op)
+        table_rows.append(base_table_row)
 
     if not unstake_operations:
         console.print("[red]No unstake operations to perform.[/red]")
@@ -287,12 +365,11 @@ async def unstake(
         wallet_name=wallet.name,
         wallet_coldkey_ss58=wallet.coldkeypub.ss58_address,
         network=subtensor.network,
-        total_received_amount=total_received_amount,
+        total_received_amount=Balance.from_rao(total_received_rao),
         safe_staking=safe_staking,
         rate_tolerance=rate_tolerance,
     )
-    for row in table_rows:
-        table.add_row(*row)
+    _bulk_add_rows(table, table_rows)
 
     _print_table_and_slippage(table, max_float_slippage, safe_staking)
     if prompt:
@@ -305,29 +382,20 @@ async def unstake(
 
     successes = []
     with console.status("\n:satellite: Performing unstaking operations...") as status:
-        for op in unstake_operations:
-            common_args = {
-                "wallet": wallet,
-                "subtensor": subtensor,
-                "netuid": op["netuid"],
-                "amount": op["amount_to_unstake"],
-                "hotkey_ss58": op["hotkey_ss58"],
-                "status": status,
-                "era": era,
-            }
-
-            if safe_staking and op["netuid"] != 0:
-                func = _safe_unstake_extrinsic
-                specific_args = {
-                    "price_limit": op["price_with_tolerance"],
-                    "allow_partial_stake": allow_partial_stake,
-                }
-            else:
-                func = _unstake_extrinsic
-                specific_args = {"current_stake": op["current_stake_balance"]}
-
-            suc = await func(**common_args, **specific_args)
-
+        current_balance, results = await asyncio.gather(
+            subtensor.get_balance(wallet.coldkeypub.ss58_address, chain_head),
+            _submit_unstake_operations(
+                wallet=wallet,
+                subtensor=subtensor,
+                unstake_operations=unstake_operations,
+                safe_staking=safe_staking,
+                allow_partial_stake=allow_partial_stake,
+                era=era,
+                block_hash=chain_head,
+                status=status,
+            ),
+        )
+        for op, suc in zip(unstake_operations, results):
             successes.append(
                 {
                     "netuid": op["netuid"],
@@ -337,9 +405,26 @@ async def unstake(
                 }
             )
 
-    console.print(
-        f"[{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}]Unstaking operations completed."
-    )
+        if any(result["success"] for result in successes):
+            # Fetch the latest balance and stakes once for all operations
+            block_hash = await subtensor.substrate.get_chain_head()
+            new_balance, new_stake_infos = await asyncio.gather(
+                subtensor.get_balance(wallet.coldkeypub.ss58_address, block_hash),
+                subtensor.get_stake_for_coldkey(
+                    wallet.coldkeypub.ss58_address, block_hash=block_hash
+                ),
+            )
+            _print_unstake_results(
+                unstake_operations,
+                successes,
+                current_balance,
+                new_balance,
+                new_stake_infos,
+                safe_staking,
+                allow_partial_stake,
+            )
+
+    console.print(f"[{_C_STAKE_AMOUNT}]Unstaking operations completed.")
     if json_output:
         json_console.print(json.dumps(successes))
 
@@ -355,27 +440,41 @@ async def unstake_all(
     era: int = 3,
     prompt: bool = True,
     json_output: bool = False,
+    prefetched: Optional[tuple[list, dict, dict, list]] = None,
 ) -> bool:
-    """Unstakes all stakes from all hotkeys in all subnets."""
+    """Unstakes all stakes from all hotkeys in all subnets.
+
+    `prefetched` optionally holds the (stake infos, coldkey/hotkey identities, delegate
+    identities, dynamic info) already retrieved by the caller, so they are not fetched
+    again.
+    """
     include_hotkeys = include_hotkeys or []
     exclude_hotkeys = exclude_hotkeys or []
     with console.status(
         f"Retrieving stake information & identities from {subtensor.network}...",
         spinner="earth",
     ):
-        (
-            stake_info,
-            ck_hk_identities,
-            old_identities,
-            all_sn_dynamic_info_,
-            current_wallet_balance,
-        ) = await asyncio.gather(
-            subtensor.get_stake_for_coldkey(wallet.coldkeypub.ss58_address),
-            subtensor.fetch_coldkey_hotkey_identities(),
-            subtensor.get_delegate_identities(),
-            subtensor.all_subnets(),
-            subtensor.get_balance(wallet.coldkeypub.ss58_address),
-        )
+        if prefetched:
+            stake_info, ck_hk_identities, old_identities, all_sn_dynamic_info_ = (
+                prefetched
+            )
+            current_wallet_balance = await subtensor.get_balance(
+                wallet.coldkeypub.ss58_address
+            )
+        else:
+            (
+                stake_info,
+                ck_hk_identities,
+                old_identities,
+                all_sn_dynamic_info_,
+                current_wallet_balance,
+            ) = await asyncio.gather(
+                subtensor.get_stake_for_coldkey(wallet.coldkeypub.ss58_address),
+                subtensor.fetch_coldkey_hotkey_identities(),
+                subtensor.get_delegate_identities(),
+                subtensor.all_subnets(),
+                subtensor.get_balance(wallet.coldkeypub.ss58_address),
+            )
 
         if all_hotkeys:
             hotkeys = _get_hotkeys_to_unstake(
@@ -398,6 +497,9 @@ async def unstake_all(
         stake_info = [
             stake for stake in stake_info if stake.hotkey_ss58 in hotkey_ss58s
         ]
+        previous_root_stakes = {
+            stake.hotkey_ss58: stake.stake for stake in stake_info if stake.netuid == 0
+        }
 
         if unstake_all_alpha:
             stake_info = [stake for stake in stake_info if stake.netuid != 0]
@@ -416,10 +518,10 @@ async def unstake_all(
         )
         table = Table(
             title=(
-                f"\n[{COLOR_PALETTE['GENERAL']['HEADER']}]{table_title}[/{COLOR_PALETTE['GENERAL']['HEADER']}]\n"
-                f"Wallet: [{COLOR_PALETTE['GENERAL']['COLDKEY']}]{wallet.name}[/{COLOR_PALETTE['GENERAL']['COLDKEY']}], "
-                f"Coldkey ss58: [{COLOR_PALETTE['GENERAL']['COLDKEY']}]{wallet.coldkeypub.ss58_address}[/{COLOR_PALETTE['GENERAL']['COLDKEY']}]\n"
-                f"Network: [{COLOR_PALETTE['GENERAL']['HEADER']}]{subtensor.network}[/{COLOR_PALETTE['GENERAL']['HEADER']}]\n"
+                f"\n[{_C_HEADER}]{table_title}[/{_C_HEADER}]\n"
+                f"Wallet: [{_C_COLDKEY}]{wallet.name}[/{_C_COLDKEY}], "
+                f"Coldkey ss58: [{_C_COLDKEY}]{wallet.coldkeypub.ss58_address}[/{_C_COLDKEY}]\n"
+                f"Network: [{_C_HEADER}]{subtensor.network}[/{_C_HEADER}]\n"
             ),
             show_footer=True,
             show_edge=False,
@@ -431,54 +533,61 @@ async def unstake_all(
             pad_edge=True,
         )
         table.add_column("Netuid", justify="center", style="grey89")
+        table.add_column("Hotkey", justify="center", style=_C_HOTKEY)
         table.add_column(
-            "Hotkey", justify="center", style=COLOR_PALETTE["GENERAL"]["HOTKEY"]
-        )
-        table.add_column(
-            f"Current Stake ({Balance.get_unit(1)})",
+            f"Current Stake ({_UNIT_ALPHA})",
             justify="center",
-            style=COLOR_PALETTE["STAKE"]["STAKE_ALPHA"],
+            style=_C_STAKE_ALPHA,
         )
         table.add_column(
-            f"Rate ({Balance.unit}/{Balance.get_unit(1)})",
+            f"Rate ({Balance.unit}/{_UNIT_ALPHA})",
             justify="center",
-            style=COLOR_PALETTE["POOLS"]["RATE"],
+            style=_C_RATE,
         )
         table.add_column(
             f"Fee ({Balance.unit})",
             justify="center",
-            style=COLOR_PALETTE["STAKE"]["STAKE_AMOUNT"],
+            style=_C_STAKE_AMOUNT,
         )
         # table.add_column(
         #     f"Received ({Balance.unit})",
         #     justify="center",
-        #     style=COLOR_PALETTE["POOLS"]["TAO_EQUIV"],
+        #     style=_C_TAO_EQUIV,
         # )
         # table.add_column(
         #     "Slippage",
         #     justify="center",
-        #     style=COLOR_PALETTE["STAKE"]["SLIPPAGE_PERCENT"],
+        #     style=_C_SLIPPAGE_PERCENT,
         # )
 
         # Calculate slippage and total received
         max_slippage = 0.0
-        total_received_value = Balance(0)
-        for stake in stake_info:
-            if stake.stake.rao == 0:
-                continue
-
+        total_received_rao = 0
+        rate_units = {
+            netuid: f"{_UNIT_TAO}/{Balance.get_unit(netuid)}"
+            for netuid in {stake.netuid for stake in stake_info}
+        }
+        stake_info = [stake for stake in stake_info if stake.stake.rao != 0]
+        # Start all fee queries up front; they are awaited in row order below
+        fee_tasks = [
+            asyncio.create_task(
+                subtensor.get_stake_fee(
+                    origin_hotkey_ss58=stake.hotkey_ss58,
+                    origin_netuid=stake.netuid,
+                    origin_coldkey_ss58=wallet.coldkeypub.ss58_address,
+                    destination_hotkey_ss58=None,
+                    destination_netuid=None,
+                    destination_coldkey_ss58=wallet.coldkeypub.ss58_address,
+                    amount=stake.stake.rao,
+                )
+            )
+            for stake in stake_info
+        ]
+        for stake, fee_task in zip(stake_info, fee_tasks):
             hotkey_display = hotkey_names.get(stake.hotkey_ss58, stake.hotkey_ss58)
             subnet_info = all_sn_dynamic_info.get(stake.netuid)
             stake_amount = stake.stake
-            stake_fee = await subtensor.get_stake_fee(
-                origin_hotkey_ss58=stake.hotkey_ss58,
-                origin_netuid=stake.netuid,
-                origin_coldkey_ss58=wallet.coldkeypub.ss58_address,
-                destination_hotkey_ss58=None,
-                destination_netuid=None,
-                destination_coldkey_ss58=wallet.coldkeypub.ss58_address,
-                amount=stake_amount.rao,
-            )
+            stake_fee = await fee_task
             try:
                 received_amount, slippage_pct, slippage_pct_float = _calculate_slippage(
                     subnet_info=subnet_info, amount=stake_amount, stake_fee=stake_fee
@@ -487,14 +596,13 @@ async def unstake_all(
                 continue
 
             max_slippage = max(max_slippage, slippage_pct_float)
-            total_received_value += received_amount
+            total_received_rao += received_amount.rao
 
             table.add_row(
                 str(stake.netuid),
                 hotkey_display,
                 str(stake_amount),
-                str(float(subnet_info.price))
-                + f"({Balance.get_unit(0)}/{Balance.get_unit(stake.netuid)})",
+                f"{float(subnet_info.price)}({rate_units[stake.netuid]})",
                 str(stake_fee),
                 # str(received_amount),
                 # slippage_pct,
@@ -502,18 +610,18 @@ async def unstake_all(
     console.print(table)
     if max_slippage > 5:
         message = (
-            f"[{COLOR_PALETTE['STAKE']['SLIPPAGE_TEXT']}]--------------------------------------------------------------"
+            f"[{_C_SLIPPAGE_TEXT}]--------------------------------------------------------------"
             f"-----------------------------------------------------\n"
             f"[bold]WARNING:[/bold] The slippage on one of your operations is high: "
-            f"[{COLOR_PALETTE['STAKE']['SLIPPAGE_PERCENT']}]{max_slippage:.4f}%"
-            f"[/{COLOR_PALETTE['STAKE']['SLIPPAGE_PERCENT']}], this may result in a loss of funds.\n"
+            f"[{_C_SLIPPAGE_PERCENT}]{max_slippage:.4f}%"
+            f"[/{_C_SLIPPAGE_PERCENT}], this may result in a loss of funds.\n"
             "----------------------------------------------------------------------------------------------------------"
             "---------\n"
         )
         console.print(message)
 
     console.print(
-        f"Expected return after slippage: [{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}]{total_received_value}"
+        f"Expected return after slippage: [{_C_STAKE_AMOUNT}]{Balance.from_rao(total_received_rao)}"
     )
 
     if prompt and not Confirm.ask(
@@ -535,32 +643,250 @@ async def unstake_all(
                 status=status,
                 era=era,
             )
+
+        if any(successes.values()):
+            # Fetch the latest balance and root stakes once for all hotkeys
+            block_hash = await subtensor.substrate.get_chain_head()
+            if unstake_all_alpha:
+                new_balance, new_stake_info = await asyncio.gather(
+                    subtensor.get_balance(
+                        wallet.coldkeypub.ss58_address, block_hash=block_hash
+                    ),
+                    subtensor.get_stake_for_coldkey(
+                        wallet.coldkeypub.ss58_address, block_hash=block_hash
+                    ),
+                )
+            else:
+                new_balance = await subtensor.get_balance(
+                    wallet.coldkeypub.ss58_address, block_hash=block_hash
+                )
+                new_stake_info = []
+
+    if any(successes.values()):
+        console.print(
+            f"Balance:\n [blue]{current_wallet_balance}[/blue] :arrow_right: [{_C_STAKE_AMOUNT}]{new_balance}"
+        )
+        if unstake_all_alpha:
+            new_root_stakes = {
+                stake.hotkey_ss58: stake.stake
+                for stake in new_stake_info
+                if stake.netuid == 0
+            }
+            for hotkey_ss58, success in successes.items():
+                if not success:
+                    continue
+                console.print(
+                    f"Root Stake for {hotkey_names.get(hotkey_ss58, hotkey_ss58)}:\n "
+                    f"[blue]{previous_root_stakes.get(hotkey_ss58, Balance(0))}[/blue] :arrow_right: "
+                    f"[{_C_STAKE_AMOUNT}]{new_root_stakes.get(hotkey_ss58, Balance(0))}"
+                )
+
     if json_output:
         return json_console.print(json.dumps({"success": successes}))
 
 
 # Extrinsics
+async def _submit_unstake_operations(
+    wallet: Wallet,
+    subtensor: "SubtensorInterface",
+    unstake_operations: list[dict],
+    safe_staking: bool,
+    allow_partial_stake: bool,
+    era: int = 3,
+    block_hash: Optional[str] = None,
+    status=None,
+) -> list[bool]:
+    """Submit the unstake operations and wait for them to be included.
+
+    All operations are signed by the same coldkey, so they are submitted one at a time in
+    nonce order, and only their inclusion is awaited concurrently. When the pool rejects an
+    operation its nonce is not used, so the next nonce is fetched again before submitting the
+    remaining operations; otherwise they would be stuck behind the gap until their era ends.
+
+    Returns:
+        Whether each operation succeeded, in the order of `unstake_operations`.
+    """
+    nonce = await subtensor.substrate.get_account_next_index(
+        wallet.coldkeypub.ss58_address
+    )
+    # Mortal eras are rounded up to a power of two, with a minimum of 4 blocks
+    period = max(4, 1 << (era - 1).bit_length())
+    receipts = []
+    era_starts = []
+    for op in unstake_operations:
+        # Each operation's era starts at the finalized block it is signed at, so the later
+        # operations stay valid for longer than the earlier ones
+        era_start = await subtensor.substrate.get_block_number(
+            await subtensor.substrate.get_chain_finalised_head()
+        )
+        common_args = {
+            "wallet": wallet,
+            "subtensor": subtensor,
+            "netuid": op["netuid"],
+            "amount": op["amount_to_unstake"],
+            "hotkey_ss58": op["hotkey_ss58"],
+            "status": status,
+            "era": era,
+            "era_start": era_start,
+            "nonce": nonce,
+        }
+
+        if safe_staking and op["netuid"] != 0:
+            func = _safe_unstake_extrinsic
+            specific_args = {
+                "price_limit": op["price_with_tolerance"],
+                "allow_partial_stake": allow_partial_stake,
+                "block_hash": block_hash,
+            }
+        else:
+            func = _unstake_extrinsic
+            specific_args = {}
+
+        receipt = await func(**common_args, **specific_args)
+        if receipt is None:
+            nonce = await subtensor.substrate.get_account_next_index(
+                wallet.coldkeypub.ss58_address
+            )
+        else:
+            nonce += 1
+        receipts.append(receipt)
+        era_starts.append(era_start)
+
+    await _wait_for_inclusion(
+        subtensor,
+        [
+            (receipt, era_start + period)
+            for receipt, era_start in zip(receipts, era_starts)
+            if receipt is not None
+        ],
+        min(era_starts, default=0),
+    )
+    return list(
+        await asyncio.gather(
+            *(
+                _check_unstake_receipt(
+                    receipt, op["amount_to_unstake"], op["netuid"], status
+                )
+                for op, receipt in zip(unstake_operations, receipts)
+            )
+        )
+    )
+
+
+async def _wait_for_inclusion(
+    subtensor: "SubtensorInterface",
+    receipts: list[tuple[AsyncExtrinsicReceipt, int]],
+    start_block: int,
+) -> None:
+    """Set the block hash of each receipt once its extrinsic is in a finalized block.
+
+    Finalized blocks are scanned from `start_block`. Each receipt stays pending until its
+    extrinsic is found or the last block of its own era has been scanned. Receipts whose
+    extrinsic was not included keep a `block_hash` of None.
+
+    Args:
+        subtensor: Subtensor interface
+        receipts: Each receipt with the last block its extrinsic can be included in
+        start_block: The block to start scanning from
+    """
+    pending = {receipt.extrinsic_hash: (receipt, last) for receipt, last in receipts}
+    block_number = start_block
+    finalized_number = -1
+    while pending and block_number <= max(last for _, last in pending.values()):
+        if block_number > finalized_number:
+            finalized_number = await subtensor.substrate.get_block_number(
+                await subtensor.substrate.get_chain_finalised_head()
+            )
+            if block_number > finalized_number:
+                await asyncio.sleep(1)
+                continue
+        block_hash = await subtensor.substrate.get_block_hash(block_number)
+        block = await subtensor.substrate.get_block(block_hash=block_hash)
+        for extrinsic in block["extrinsics"]:
+            if extrinsic is None or not extrinsic.extrinsic_hash:
+                continue
+            found = pending.pop(f"0x{extrinsic.extrinsic_hash.hex()}", None)
+            if found is not None:
+                found[0].block_hash = block_hash
+        block_number += 1
+
+
+def _mortal_era(period: int, start: Optional[int] = None) -> dict:
+    """Builds the era of an extrinsic, starting at `start` if given."""
+    if start is None:
+        return {"period": period}
+    return {"period": period, "current": start}
+
+
+async def _check_unstake_receipt(
+    receipt: Optional[AsyncExtrinsicReceipt],
+    amount: Balance,
+    netuid: int,
+    status=None,
+) -> bool:
+    """Report the outcome of a submitted unstake extrinsic.
+
+    Args:
+        receipt: Receipt of the submitted extrinsic, or None if it was rejected
+        amount: Amount to unstake
+        netuid: The subnet ID
+        status: Optional status for console updates
+    """
+    if receipt is None:
+        return False
+    failure_prelude = (
+        f":cross_mark: [red]Failed[/red] to unstake {amount} on Netuid {netuid}"
+    )
+    if receipt.block_hash is None:
+        print_error(
+            f"\n{failure_prelude}: the extrinsic was not included before it expired.",
+            status=status,
+        )
+        return False
+    try:
+        if not await receipt.is_success:
+            print_error(
+                f"\n{failure_prelude} with error: "
+                f"{format_error_message(await receipt.error_message)}",
+                status=status,
+            )
+            return False
+    except Exception as e:
+        print_error(f"\n{failure_prelude} with error: {str(e)}", status=status)
+        return False
+
+    console.print(
+        f":white_heavy_check_mark: [green]Finalized[/green] unstake of {amount} on Netuid {netuid}"
+    )
+    return True
+
+
 async def _unstake_extrinsic(
     wallet: Wallet,
     subtensor: "SubtensorInterface",
     netuid: int,
     amount: Balance,
-    current_stake: Balance,
     hotkey_ss58: str,
     status=None,
     era: int = 3,
-) -> bool:
-    """Execute a standard unstake extrinsic.
+    era_start: Optional[int] = None,
+    nonce: Optional[int] = None,
+) -> Optional[AsyncExtrinsicReceipt]:
+    """Submit a standard unstake extrinsic without waiting for its inclusion.
 
     Args:
         netuid: The subnet ID
         amount: Amount to unstake
-        current_stake: Current stake balance
         hotkey_ss58: Hotkey SS58 address
         wallet: Wallet instance
         subtensor: Subtensor interface
         status: Optional status for console updates
         era: blocks for which the transaction is valid
+        era_start: Block the era starts at. The finalized head if not provided.
+        nonce: Nonce to sign the extrinsic with. Fetched from the chain if not provided.
+
+    Returns:
+        The receipt of the submitted extrinsic, or None if it was rejected.
     """
     err_out = partial(print_error, status=status)
     failure_prelude = (
@@ -572,57 +898,26 @@ async def _unstake_extrinsic(
             f"\n:satellite: Unstaking {amount} from {hotkey_ss58} on netuid: {netuid} ..."
         )
 
-    current_balance, call = await asyncio.gather(
-        subtensor.get_balance(wallet.coldkeypub.ss58_address),
-        subtensor.substrate.compose_call(
-            call_module="SubtensorModule",
-            call_function="remove_stake",
-            call_params={
-                "hotkey": hotkey_ss58,
-                "netuid": netuid,
-                "amount_unstaked": amount.rao,
-            },
-        ),
+    call = await subtensor.substrate.compose_call(
+        call_module="SubtensorModule",
+        call_function="remove_stake",
+        call_params={
+            "hotkey": hotkey_ss58,
+            "netuid": netuid,
+            "amount_unstaked": amount.rao,
+        },
     )
     extrinsic = await subtensor.substrate.create_signed_extrinsic(
-        call=call, keypair=wallet.coldkey, era={"period": era}
+        call=call, keypair=wallet.coldkey, nonce=nonce, era=_mortal_era(era, era_start)
     )
 
     try:
-        response = await subtensor.substrate.submit_extrinsic(
-            extrinsic, wait_for_inclusion=True, wait_for_finalization=False
+        return await subtensor.substrate.submit_extrinsic(
+            extrinsic, wait_for_inclusion=False, wait_for_finalization=False
         )
-        if not await response.is_success:
-            err_out(
-                f"{failure_prelude} with error: "
-                f"{format_error_message(await response.error_message)}"
-            )
-            return False
-        # Fetch latest balance and stake
-        block_hash = await subtensor.substrate.get_chain_head()
-        new_balance, new_stake = await asyncio.gather(
-            subtensor.get_balance(wallet.coldkeypub.ss58_address, block_hash),
-            subtensor.get_stake(
-                hotkey_ss58=hotkey_ss58,
-                coldkey_ss58=wallet.coldkeypub.ss58_address,
-                netuid=netuid,
-                block_hash=block_hash,
-            ),
-        )
-
-        console.print(":white_heavy_check_mark: [green]Finalized[/green]")
-        console.print(
-            f"Balance:\n  [blue]{current_balance}[/blue] :arrow_right: [{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}]{new_balance}"
-        )
-        console.print(
-            f"Subnet: [{COLOR_PALETTE['GENERAL']['SUBHEADING']}]{netuid}[/{COLOR_PALETTE['GENERAL']['SUBHEADING']}]"
-            f" Stake:\n  [blue]{current_stake}[/blue] :arrow_right: [{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}]{new_stake}"
-        )
-        return True
-
     except Exception as e:
         err_out(f"{failure_prelude} with error: {str(e)}")
-        return False
+        return None
 
 
 async def _safe_unstake_extrinsic(
@@ -635,8 +930,11 @@ async def _safe_unstake_extrinsic(
     allow_partial_stake: bool,
     status=None,
     era: int = 3,
-) -> bool:
-    """Execute a safe unstake extrinsic with price limit.
+    era_start: Optional[int] = None,
+    nonce: Optional[int] = None,
+    block_hash: Optional[str] = None,
+) -> Optional[AsyncExtrinsicReceipt]:
+    """Submit a safe unstake extrinsic with price limit without waiting for its inclusion.
 
     Args:
         netuid: The subnet ID
@@ -647,6 +945,13 @@ async def _safe_unstake_extrinsic(
         subtensor: Subtensor interface
         allow_partial_stake: Whether to allow partial unstaking
         status: Optional status for console updates
+        era: blocks for which the transaction is valid
+        era_start: Block the era starts at. The finalized head if not provided.
+        nonce: Nonce to sign the extrinsic with. Fetched from the chain if not provided.
+        block_hash: Block hash to compose the call at. The chain head if not provided.
+
+    Returns:
+        The receipt of the submitted extrinsic, or None if it was rejected.
     """
     err_out = partial(print_error, status=status)
     failure_prelude = (
@@ -658,38 +963,33 @@ async def _safe_unstake_extrinsic(
             f"\n:satellite: Unstaking {amount} from {hotkey_ss58} on netuid: {netuid} ..."
         )
 
-    block_hash = await subtensor.substrate.get_chain_head()
+    if block_hash is None:
+        block_hash = await subtensor.substrate.get_chain_head()
+    if nonce is None:
+        nonce = await subtensor.substrate.get_account_next_index(
+            wallet.coldkeypub.ss58_address
+        )
 
-    current_balance, next_nonce, current_stake, call = await asyncio.gather(
-        subtensor.get_balance(wallet.coldkeypub.ss58_address, block_hash),
-        subtensor.substrate.get_account_next_index(wallet.coldkeypub.ss58_address),
-        subtensor.get_stake(
-            hotkey_ss58=hotkey_ss58,
-            coldkey_ss58=wallet.coldkeypub.ss58_address,
-            netuid=netuid,
-            block_hash=block_hash,
-        ),
-        subtensor.substrate.compose_call(
-            call_module="SubtensorModule",
-            call_function="remove_stake_limit",
-            call_params={
-                "hotkey": hotkey_ss58,
-                "netuid": netuid,
-                "amount_unstaked": amount.rao,
-                "limit_price": price_limit,
-                "allow_partial": allow_partial_stake,
-            },
-            block_hash=block_hash,
-        ),
+    call = await subtensor.substrate.compose_call(
+        call_module="SubtensorModule",
+        call_function="remove_stake_limit",
+        call_params={
+            "hotkey": hotkey_ss58,
+            "netuid": netuid,
+            "amount_unstaked": amount.rao,
+            "limit_price": price_limit,
+            "allow_partial": allow_partial_stake,
+        },
+        block_hash=block_hash,
     )
 
     extrinsic = await subtensor.substrate.create_signed_extrinsic(
-        call=call, keypair=wallet.coldkey, nonce=next_nonce, era={"period": era}
+        call=call, keypair=wallet.coldkey, nonce=nonce, era=_mortal_era(era, era_start)
     )
 
     try:
-        response = await subtensor.substrate.submit_extrinsic(
-            extrinsic, wait_for_inclusion=True, wait_for_finalization=False
+        return await subtensor.substrate.submit_extrinsic(
+            extrinsic, wait_for_inclusion=False, wait_for_finalization=False
         )
     except SubstrateRequestException as e:
         if "Custom error: 8" in str(e):
@@ -701,44 +1001,7 @@ async def _safe_unstake_extrinsic(
             )
         else:
             err_out(f"\n{failure_prelude} with error: {format_error_message(e)}")
-        return False
-
-    if not await response.is_success:
-        err_out(
-            f"\n{failure_prelude} with error: {format_error_message(await response.error_message)}"
-        )
-        return False
-
-    block_hash = await subtensor.substrate.get_chain_head()
-    new_balance, new_stake = await asyncio.gather(
-        subtensor.get_balance(wallet.coldkeypub.ss58_address, block_hash),
-        subtensor.get_stake(
-            hotkey_ss58=hotkey_ss58,
-            coldkey_ss58=wallet.coldkeypub.ss58_address,
-            netuid=netuid,
-            block_hash=block_hash,
-        ),
-    )
-
-    console.print(":white_heavy_check_mark: [green]Finalized[/green]")
-    console.print(
-        f"Balance:\n  [blue]{current_balance}[/blue] :arrow_right: [{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}]{new_balance}"
-    )
-
-    amount_unstaked = current_stake - new_stake
-    if allow_partial_stake and (amount_unstaked != amount):
-        console.print(
-            "Partial unstake transaction. Unstaked:\n"
-            f"  [{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}]{amount_unstaked.set_unit(netuid=netuid)}[/{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}] "
-            f"instead of "
-            f"[blue]{amount}[/blue]"
-        )
-
-    console.print(
-        f"Subnet: [{COLOR_PALETTE['GENERAL']['SUBHEADING']}]{netuid}[/{COLOR_PALETTE['GENERAL']['SUBHEADING']}] "
-        f"Stake:\n  [blue]{current_stake}[/blue] :arrow_right: [{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}]{new_stake}"
-    )
-    return True
+        return None
 
 
 async def _unstake_all_extrinsic(
@@ -749,7 +1012,7 @@ async def _unstake_all_extrinsic(
     unstake_all_alpha: bool,
     status=None,
     era: int = 3,
-) -> None:
+) -> bool:
     """Execute an unstake all extrinsic.
 
     Args:
@@ -770,25 +1033,6 @@ async def _unstake_all_extrinsic(
             f"\n:satellite: {'Unstaking all Alpha stakes' if unstake_all_alpha else 'Unstaking all stakes'} from {hotkey_name} ..."
         )
 
-    block_hash = await subtensor.substrate.get_chain_head()
-    if unstake_all_alpha:
-        previous_root_stake, current_balance = await asyncio.gather(
-            subtensor.get_stake(
-                hotkey_ss58=hotkey_ss58,
-                coldkey_ss58=wallet.coldkeypub.ss58_address,
-                netuid=0,
-                block_hash=block_hash,
-            ),
-            subtensor.get_balance(
-                wallet.coldkeypub.ss58_address, block_hash=block_hash
-            ),
-        )
-    else:
-        current_balance = await subtensor.get_balance(
-            wallet.coldkeypub.ss58_address, block_hash=block_hash
-        )
-        previous_root_stake = None
-
     call_function = "unstake_all_alpha" if unstake_all_alpha else "unstake_all"
     call = await subtensor.substrate.compose_call(
         call_module="SubtensorModule",
@@ -810,27 +1054,7 @@ async def _unstake_all_extrinsic(
                 f"{failure_prelude} with error: "
                 f"{format_error_message(await response.error_message)}"
             )
-            return
-
-        # Fetch latest balance and stake
-        block_hash = await subtensor.substrate.get_chain_head()
-        if unstake_all_alpha:
-            new_root_stake, new_balance = await asyncio.gather(
-                subtensor.get_stake(
-                    hotkey_ss58=hotkey_ss58,
-                    coldkey_ss58=wallet.coldkeypub.ss58_address,
-                    netuid=0,
-                    block_hash=block_hash,
-                ),
-                subtensor.get_balance(
-                    wallet.coldkeypub.ss58_address, block_hash=block_hash
-                ),
-            )
-        else:
-            new_balance = await subtensor.get_balance(
-                wallet.coldkeypub.ss58_address, block_hash=block_hash
-            )
-            new_root_stake = None
+            return False
 
         success_message = (
             ":white_heavy_check_mark: [green]Finalized: Successfully unstaked all stakes[/green]"
@@ -838,22 +1062,37 @@ async def _unstake_all_extrinsic(
             else ":white_heavy_check_mark: [green]Finalized: Successfully unstaked all Alpha stakes[/green]"
         )
         console.print(f"{success_message} from {hotkey_name}")
-        console.print(
-            f"Balance:\n [blue]{current_balance}[/blue] :arrow_right: [{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}]{new_balance}"
-        )
-
-        if unstake_all_alpha:
-            console.print(
-                f"Root Stake for {hotkey_name}:\n "
-                f"[blue]{previous_root_stake}[/blue] :arrow_right: "
-                f"[{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}]{new_root_stake}"
-            )
+        return True
 
     except Exception as e:
         err_out(f"{failure_prelude} with error: {str(e)}")
+        return False
 
 
 # Helpers
+def _bulk_add_rows(table: Table, rows: list) -> None:
+    """Add prebuilt rows to a table.
+
+    Args:
+        table: The table to add the rows to
+        rows: Sequences of cell values, one per row
+    """
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
+
+
+async def _get_dynamic_subnet_prices(
+    subtensor: "SubtensorInterface", block_hash: Optional[str] = None
+) -> dict[int, Balance]:
+    """Fetch the swap prices of the dynamic subnets, i.e. every subnet but root."""
+    netuids = await subtensor.get_all_subnet_netuids(block_hash=block_hash)
+    dynamic_netuids = [netuid for netuid in netuids if netuid != 0]
+    if not dynamic_netuids:
+        return {}
+    return await subtensor.get_subnet_prices(*dynamic_netuids, block_hash=block_hash)
+
+
 def _calculate_slippage(
     subnet_info, amount: Balance, stake_fee: Balance
 ) -> tuple[Balance, str, float]:
@@ -870,13 +1109,17 @@ def _calculate_slippage(
         - slippage_pct: Formatted string of slippage percentage
         - slippage_pct_float: Float value of slippage percentage
 
-    TODO: Update to v3. This method only works for protocol-liquidity-only 
+    TODO: Update to v3. This method only works for protocol-liquidity-only
           mode (user liquidity disabled)
     """
-    received_amount, _, _ = subnet_info.alpha_to_tao_with_slippage(amount)
-    received_amount -= stake_fee
+    if subnet_info.is_dynamic:
+        received_amount, _, _ = subnet_info.alpha_to_tao_with_slippage(amount)
+        received_amount -= stake_fee
+    else:
+        # Static subnets convert 1:1, so there is no pool math to run
+        received_amount = Balance.from_rao(amount.rao - stake_fee.rao)
 
-    if received_amount < Balance.from_tao(0):
+    if received_amount.rao < 0:
         print_error("Not enough Alpha to pay the transaction fee.")
         raise ValueError
 
@@ -950,7 +1193,7 @@ async def _unstake_selection(
     # Display existing hotkeys, id, and staked netuids.
     subnet_filter = f" for Subnet {netuid}" if netuid is not None else ""
     table = Table(
-        title=f"\n[{COLOR_PALETTE['GENERAL']['HEADER']}]Hotkeys with Stakes{subnet_filter}\n",
+        title=f"\n[{_C_HEADER}]Hotkeys with Stakes{subnet_filter}\n",
         show_footer=True,
         show_edge=False,
         header_style="bold white",
@@ -961,16 +1204,23 @@ async def _unstake_selection(
         pad_edge=True,
     )
     table.add_column("Index", justify="right")
-    table.add_column("Identity", style=COLOR_PALETTE["GENERAL"]["SUBHEADING"])
-    table.add_column("Netuids", style=COLOR_PALETTE["GENERAL"]["NETUID"])
-    table.add_column("Hotkey Address", style=COLOR_PALETTE["GENERAL"]["HOTKEY"])
+    table.add_column("Identity", style=_C_SUBHEADING)
+    table.add_column("Netuids", style=_C_NETUID)
+    table.add_column("Hotkey Address", style=_C_HOTKEY)
 
+    rows = []
+    # Hotkeys are often staked on the same set of subnets
+    grouped_netuids: dict[tuple[int, ...], str] = {}
     for hotkey_info in hotkeys_info:
         index = str(hotkey_info["index"])
         identity = hotkey_info["identity"]
-        netuids = group_subnets([n for n in hotkey_info["netuids"]])
+        netuids_key = tuple(hotkey_info["netuids"])
+        if netuids_key not in grouped_netuids:
+            grouped_netuids[netuids_key] = group_subnets(hotkey_info["netuids"])
+        netuids = grouped_netuids[netuids_key]
         hotkey_ss58 = hotkey_info["hotkey_ss58"]
-        table.add_row(index, identity, netuids, hotkey_ss58)
+        rows.append((index, identity, netuids, hotkey_ss58))
+    _bulk_add_rows(table, rows)
 
     console.print("\n", table)
 
@@ -987,8 +1237,8 @@ async def _unstake_selection(
 
     # Display hotkey's staked netuids with amount.
     table = Table(
-        title=f"\n[{COLOR_PALETTE['GENERAL']['HEADER']}]Stakes for hotkey \n"
-        f"[{COLOR_PALETTE['GENERAL']['SUBHEADING']}]{selected_hotkey_name}\n"
+        title=f"\n[{_C_HEADER}]Stakes for hotkey \n"
+        f"[{_C_SUBHEADING}]{selected_hotkey_name}\n"
         f"{selected_hotkey_ss58}\n",
         show_footer=True,
         show_edge=False,
@@ -1000,18 +1250,24 @@ async def _unstake_selection(
         pad_edge=True,
     )
     table.add_column("Subnet", justify="right")
-    table.add_column("Symbol", style=COLOR_PALETTE["GENERAL"]["SYMBOL"])
-    table.add_column("Stake Amount", style=COLOR_PALETTE["STAKE"]["STAKE_AMOUNT"])
+    table.add_column("Symbol", style=_C_SYMBOL)
+    table.add_column("Stake Amount", style=_C_STAKE_AMOUNT)
     table.add_column(
-        f"[bold white]Rate ({Balance.get_unit(0)}/{Balance.get_unit(1)})",
-        style=COLOR_PALETTE["POOLS"]["RATE"],
+        f"[bold white]Rate ({_UNIT_TAO}/{_UNIT_ALPHA})",
+        style=_C_RATE,
         justify="left",
     )
 
-    for netuid_, stake_amount in netuid_stakes.items():
-        symbol = dynamic_info[netuid_].symbol
-        rate = f"{dynamic_info[netuid_].price.tao:.4f} τ/{symbol}"
-        table.add_row(str(netuid_), symbol, str(stake_amount), rate)
+    rows = [
+        (
+            str(netuid_),
+            (di := dynamic_info[netuid_]).symbol,
+            str(stake_amount),
+            f"{di.price.tao:.4f} τ/{di.symbol}",
+        )
+        for netuid_, stake_amount in netuid_stakes.items()
+    ]
+    _bulk_add_rows(table, rows)
     console.print("\n", table, "\n")
 
     # Ask which netuids to unstake from for the selected hotkey.
@@ -1019,6 +1275,7 @@ async def _unstake_selection(
     if netuid is not None:
         selected_netuids = [netuid]
     else:
+        valid_netuids = netuid_stakes.keys()
         while True:
             netuid_input = Prompt.ask(
                 "\nEnter the netuids of the [blue]subnets to unstake[/blue] from (comma-separated), or "
@@ -1032,8 +1289,9 @@ async def _unstake_selection(
                 break
             else:
                 try:
-                    netuid_list = [int(n.strip()) for n in netuid_input.split(",")]
-                    invalid_netuids = [n for n in netuid_list if n not in netuid_stakes]
+                    netuid_list, invalid_netuids = _parse_netuids(
+                        netuid_input, valid_netuids
+                    )
                     if invalid_netuids:
                         print_error(
                             f"The following netuids are invalid or not available: {', '.join(map(str, invalid_netuids))}. Please try again."
@@ -1054,6 +1312,30 @@ async def _unstake_selection(
     return hotkeys_to_unstake_from, unstake_all_
 
 
+def _parse_netuids(netuid_input: str, valid_netuids) -> tuple[list[int], list[int]]:
+    """Parse comma-separated netuids in a single pass.
+
+    Args:
+        netuid_input: The comma-separated netuids entered by the user
+        valid_netuids: The netuids that may be selected
+
+    Returns:
+        The parsed netuids, and those of them that are not in `valid_netuids`
+
+    Raises:
+        ValueError: On the first entry that is not an integer
+    """
+    netuids = []
+    invalid_netuids = []
+    for token in netuid_input.split(","):
+        # int() ignores surrounding whitespace itself
+        netuid = int(token)
+        netuids.append(netuid)
+        if netuid not in valid_netuids:
+            invalid_netuids.append(netuid)
+    return netuids, invalid_netuids
+
+
 def _ask_unstake_amount(
     current_stake_balance: Balance,
     netuid: int,
@@ -1071,68 +1353,64 @@ def _ask_unstake_amount(
     Returns:
         Balance amount to unstake, or None if user chooses to quit
     """
-    stake_color = COLOR_PALETTE["STAKE"]["STAKE_AMOUNT"]
     display_address = (
         staking_address_name if staking_address_name else staking_address_ss58
     )
 
     # First prompt: Ask if user wants to unstake all
     unstake_all_prompt = (
-        f"Unstake all: [{stake_color}]{current_stake_balance}[/{stake_color}]"
-        f" from [{stake_color}]{display_address}[/{stake_color}]"
-        f" on netuid: [{stake_color}]{netuid}[/{stake_color}]? [y/n/q]"
+        f"Unstake all: [{_C_STAKE_AMOUNT}]{current_stake_balance}[/{_C_STAKE_AMOUNT}]"
+        f" from [{_C_STAKE_AMOUNT}]{display_address}[/{_C_STAKE_AMOUNT}]"
+        f" on netuid: [{_C_STAKE_AMOUNT}]{netuid}[/{_C_STAKE_AMOUNT}]? [y/n/q]"
     )
 
-    while True:
-        response = Prompt.ask(
-            unstake_all_prompt,
-            choices=["y", "n", "q"],
-            default="n",
-            show_choices=True,
-        ).lower()
-
-        if response == "q":
-            return None
-        if response == "y":
-            return current_stake_balance
-        if response != "n":
-            console.print("[red]Invalid input. Please enter 'y', 'n', or 'q'.[/red]")
-            continue
-
-        amount_prompt = (
-            f"Enter amount to unstake in [{stake_color}]{Balance.get_unit(netuid)}[/{stake_color}]"
-            f" from subnet: [{stake_color}]{netuid}[/{stake_color}]"
-            f" (Max: [{stake_color}]{current_stake_balance}[/{stake_color}])"
-        )
+    # Prompt.ask only returns one of the choices, exactly as listed
+    response = Prompt.ask(
+        unstake_all_prompt,
+        choices=["y", "n", "q"],
+        default="n",
+        show_choices=True,
+    )
 
-        while True:
-            amount_input = Prompt.ask(amount_prompt)
-            if amount_input.lower() == "q":
-                return None
+    if response == "q":
+        return None
+    if response == "y":
+        return current_stake_balance
 
-            try:
-                amount_value = float(amount_input)
+    amount_prompt = (
+        f"Enter amount to unstake in [{_C_STAKE_AMOUNT}]{Balance.get_unit(netuid)}[/{_C_STAKE_AMOUNT}]"
+        f" from subnet: [{_C_STAKE_AMOUNT}]{netuid}[/{_C_STAKE_AMOUNT}]"
+        f" (Max: [{_C_STAKE_AMOUNT}]{current_stake_balance}[/{_C_STAKE_AMOUNT}])"
+    )
 
-                # Validate amount
-                if amount_value <= 0:
-                    console.print("[red]Amount must be greater than zero.[/red]")
-                    continue
+    while True:
+        amount_input = Prompt.ask(amount_prompt)
+        if amount_input in ("q", "Q"):
+            return None
 
-                amount_to_unstake = Balance.from_tao(amount_value)
-                amount_to_unstake.set_unit(netuid)
+        try:
+            amount_value = float(amount_input)
 
-                if amount_to_unstake > current_stake_balance:
-                    console.print(
-                        f"[red]Amount exceeds current stake balance of {current_stake_balance}.[/red]"
-                    )
-                    continue
+            # Validate amount
+            if amount_value <= 0:
+                console.print("[red]Amount must be greater than zero.[/red]")
+                continue
 
-                return amount_to_unstake
+            amount_to_unstake = Balance.from_tao(amount_value)
+            amount_to_unstake.set_unit(netuid)
 
-            except ValueError:
+            if amount_to_unstake > current_stake_balance:
                 console.print(
-                    "[red]Invalid input. Please enter a numeric value or 'q' to quit.[/red]"
+                    f"[red]Amount exceeds current stake balance of {current_stake_balance}.[/red]"
                 )
+                continue
+
+            return amount_to_unstake
+
+        except ValueError:
+            console.print(
+                "[red]Invalid input. Please enter a numeric value or 'q' to quit.[/red]"
+            )
 
 
 def _get_hotkeys_to_unstake(
@@ -1164,25 +1442,31 @@ def _get_hotkeys_to_unstake(
 
     if all_hotkeys:
         print_verbose("Unstaking from all hotkeys")
-        all_hotkeys_ = get_hotkey_wallets_for_wallet(wallet=wallet)
+        excluded = set(exclude_hotkeys)
+        # Excluded hotkeys are skipped before their key files are loaded
+        all_hotkeys_ = get_hotkey_wallets_for_wallet(wallet=wallet, exclude=excluded)
         wallet_hotkeys = [
             (wallet.hotkey_str, wallet.hotkey.ss58_address, None)
             for wallet in all_hotkeys_
-            if wallet.hotkey_str not in exclude_hotkeys
         ]
 
         wallet_hotkey_addresses = {hk[1] for hk in wallet_hotkeys}
-        chain_hotkeys = [
-            (
-                get_hotkey_identity(stake_info.hotkey_ss58, identities, old_identities),
-                stake_info.hotkey_ss58,
-                None,
-            )
+        # A hotkey has one stake info per subnet, so resolve each identity only once
+        chain_hotkey_addresses = dict.fromkeys(
+            stake_info.hotkey_ss58
             for stake_info in stake_infos
             if (
                 stake_info.hotkey_ss58 not in wallet_hotkey_addresses
-                and stake_info.hotkey_ss58 not in exclude_hotkeys
+                and stake_info.hotkey_ss58 not in excluded
             )
+        )
+        chain_hotkeys = [
+            (
+                get_hotkey_identity(hotkey_ss58, identities, old_identities),
+                hotkey_ss58,
+                None,
+            )
+            for hotkey_ss58 in chain_hotkey_addresses
         ]
         return wallet_hotkeys + chain_hotkeys
 
@@ -1229,10 +1513,10 @@ def _create_unstake_table(
         Rich Table object configured for unstake summary
     """
     title = (
-        f"\n[{COLOR_PALETTE['GENERAL']['HEADER']}]Unstaking to: \n"
-        f"Wallet: [{COLOR_PALETTE['GENERAL']['COLDKEY']}]{wallet_name}[/{COLOR_PALETTE['GENERAL']['COLDKEY']}], "
-        f"Coldkey ss58: [{COLOR_PALETTE['GENERAL']['COLDKEY']}]{wallet_coldkey_ss58}[/{COLOR_PALETTE['GENERAL']['COLDKEY']}]\n"
-        f"Network: {network}[/{COLOR_PALETTE['GENERAL']['HEADER']}]\n"
+        f"\n[{_C_HEADER}]Unstaking to: \n"
+        f"Wallet: [{_C_COLDKEY}]{wallet_name}[/{_C_COLDKEY}], "
+        f"Coldkey ss58: [{_C_COLDKEY}]{wallet_coldkey_ss58}[/{_C_COLDKEY}]\n"
+        f"Network: {network}[/{_C_HEADER}]\n"
     )
     table = Table(
         title=title,
@@ -1247,48 +1531,99 @@ def _create_unstake_table(
     )
 
     table.add_column("Netuid", justify="center", style="grey89")
+    table.add_column("Hotkey", justify="center", style=_C_HOTKEY)
     table.add_column(
-        "Hotkey", justify="center", style=COLOR_PALETTE["GENERAL"]["HOTKEY"]
-    )
-    table.add_column(
-        f"Amount ({Balance.get_unit(1)})",
+        f"Amount ({_UNIT_ALPHA})",
         justify="center",
-        style=COLOR_PALETTE["POOLS"]["TAO"],
+        style=_C_POOLS_TAO,
     )
     table.add_column(
-        f"Rate ({Balance.get_unit(0)}/{Balance.get_unit(1)})",
+        f"Rate ({_UNIT_TAO}/{_UNIT_ALPHA})",
         justify="center",
-        style=COLOR_PALETTE["POOLS"]["RATE"],
+        style=_C_RATE,
     )
     table.add_column(
-        f"Fee ({Balance.get_unit(0)})",
+        f"Fee ({_UNIT_TAO})",
         justify="center",
-        style=COLOR_PALETTE["STAKE"]["STAKE_AMOUNT"],
+        style=_C_STAKE_AMOUNT,
     )
     # table.add_column(
-    #     f"Received ({Balance.get_unit(0)})",
+    #     f"Received ({_UNIT_TAO})",
     #     justify="center",
-    #     style=COLOR_PALETTE["POOLS"]["TAO_EQUIV"],
+    #     style=_C_TAO_EQUIV,
     #     footer=str(total_received_amount),
     # )
     # table.add_column(
-    #     "Slippage", justify="center", style=COLOR_PALETTE["STAKE"]["SLIPPAGE_PERCENT"]
+    #     "Slippage", justify="center", style=_C_SLIPPAGE_PERCENT
     # )
     if safe_staking:
         table.add_column(
             f"Rate with tolerance: [blue]({rate_tolerance * 100}%)[/blue]",
             justify="center",
-            style=COLOR_PALETTE["POOLS"]["RATE"],
+            style=_C_RATE,
         )
         table.add_column(
             "Partial unstake enabled",
             justify="center",
-            style=COLOR_PALETTE["STAKE"]["SLIPPAGE_PERCENT"],
+            style=_C_SLIPPAGE_PERCENT,
         )
 
     return table
 
 
+def _print_unstake_results(
+    unstake_operations: list[dict],
+    results: list[dict],
+    current_balance: Balance,
+    new_balance: Balance,
+    new_stake_infos: list,
+    safe_staking: bool,
+    allow_partial_stake: bool,
+) -> None:
+    """Print the balance and per-subnet stake changes of the completed unstake operations.
+
+    Args:
+        unstake_operations: The unstake operations that were submitted
+        results: The outcome of each operation, in the same order as `unstake_operations`
+        current_balance: Coldkey balance before unstaking
+        new_balance: Coldkey balance after unstaking
+        new_stake_infos: The coldkey's stakes after unstaking
+        safe_staking: Whether safe unstaking was used
+        allow_partial_stake: Whether partial unstaking was allowed
+    """
+    new_stakes = {(s.hotkey_ss58, s.netuid): s.stake for s in new_stake_infos}
+    console.print(
+        f"Balance:\n  [blue]{current_balance}[/blue] :arrow_right: [{_C_STAKE_AMOUNT}]{new_balance}"
+    )
+    for op, result in zip(unstake_operations, results):
+        if not result["success"]:
+            continue
+        netuid = op["netuid"]
+        current_stake = op["current_stake_balance"]
+        new_stake = new_stakes.get(
+            (op["hotkey_ss58"], netuid), Balance.from_rao(0)
+        ).set_unit(netuid)
+
+        amount_unstaked = current_stake - new_stake
+        if (
+            safe_staking
+            and netuid != 0
+            and allow_partial_stake
+            and amount_unstaked != op["amount_to_unstake"]
+        ):
+            console.print(
+                "Partial unstake transaction. Unstaked:\n"
+                f"  [{_C_STAKE_AMOUNT}]{amount_unstaked.set_unit(netuid=netuid)}[/{_C_STAKE_AMOUNT}] "
+                f"instead of "
+                f"[blue]{op['amount_to_unstake']}[/blue]"
+            )
+
+        console.print(
+            f"Subnet: [{_C_SUBHEADING}]{netuid}[/{_C_SUBHEADING}] "
+            f"Stake:\n  [blue]{current_stake}[/blue] :arrow_right: [{_C_STAKE_AMOUNT}]{new_stake}"
+        )
+
+
 def _print_table_and_slippage(
     table: Table,
     max_float_slippage: float,
@@ -1305,28 +1640,12 @@ def _print_table_and_slippage(
     if max_float_slippage > 5:
         console.print(
             "\n"
-            f"[{COLOR_PALETTE['STAKE']['SLIPPAGE_TEXT']}]-------------------------------------------------------------------------------------------------------------------\n"
-            f"[bold]WARNING:[/bold]  The slippage on one of your operations is high: [{COLOR_PALETTE['STAKE']['SLIPPAGE_PERCENT']}]{max_float_slippage} %[/{COLOR_PALETTE['STAKE']['SLIPPAGE_PERCENT']}],"
+            f"[{_C_SLIPPAGE_TEXT}]-------------------------------------------------------------------------------------------------------------------\n"
+            f"[bold]WARNING:[/bold]  The slippage on one of your operations is high: [{_C_SLIPPAGE_PERCENT}]{max_float_slippage} %[/{_C_SLIPPAGE_PERCENT}],"
             " this may result in a loss of funds.\n"
             f"-------------------------------------------------------------------------------------------------------------------\n"
         )
-    base_description = """
-[bold white]Description[/bold white]:
-The table displays information about the stake remove operation you are about to perform.
-The columns are as follows:
-    - [bold white]Netuid[/bold white]: The netuid of the subnet you are unstaking from.
-    - [bold white]Hotkey[/bold white]: The ss58 address or identity of the hotkey you are unstaking from. 
-    - [bold white]Amount to Unstake[/bold white]: The stake amount you are removing from this key.
-    - [bold white]Rate[/bold white]: The rate of exchange between TAO and the subnet's stake.
-    - [bold white]Fee[/bold white]: The transaction fee for this unstake operation.
-    - [bold white]Received[/bold white]: The amount of free balance TAO you will receive on this subnet after slippage and fees.
-    - [bold white]Slippage[/bold white]: The slippage percentage of the unstake operation. (0% if the subnet is not dynamic i.e. root)."""
-
-    safe_staking_description = """
-    - [bold white]Rate Tolerance[/bold white]: Maximum acceptable alpha rate. If the rate reduces below this tolerance, the transaction will be limited or rejected.
-    - [bold white]Partial unstaking[/bold white]: If True, allows unstaking up to the rate tolerance limit. If False, the entire transaction will fail if rate tolerance is exceeded.\n"""
-
-    console.print(base_description + (safe_staking_description if safe_staking else ""))
+    console.print(_SAFE_UNSTAKE_DESCRIPTION if safe_staking else _UNSTAKE_DESCRIPTION)
 
 
 def get_hotkey_identity(
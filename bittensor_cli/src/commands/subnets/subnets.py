@@ -1,13 +1,16 @@
 import asyncio
 import json
 import sqlite3
+from operator import itemgetter
 from typing import TYPE_CHECKING, Optional, cast
 
 from bittensor_wallet import Wallet
+import numpy as np
 from rich.prompt import Confirm, Prompt
 from rich.console import Group
 from rich.progress import Progress, BarColumn, TextColumn
 from rich.table import Column, Table
+from rich.text import Text
 from rich import box
 
 from bittensor_cli.src import COLOR_PALETTE, Constants
@@ -29,6 +32,7 @@ from bittensor_cli.src.bittensor.utils import (
     format_error_message,
     get_metadata_table,
     millify_tao,
+    read_table,
     render_table,
     update_metadata_table,
     prompt_for_identity,
@@ -81,14 +85,15 @@ async def register_subnetwork_extrinsic(
 
         :return: A list of attributes for the specified event. Returns [-1] if the event is not found.
         """
-        for event in await response_.triggered_events:
-            # Access the event details
-            event_details = event["event"]
-            # Check if the event_id is 'NetworkAdded'
-            if event_details["event_id"] == event_name:
-                # Once found, you can access the attributes of the event_name
-                return event_details["attributes"]
-        return [-1]
+        events = await response_.triggered_events
+        return next(
+            (
+                event["event"]["attributes"]
+                for event in events
+                if event["event"]["event_id"] == event_name
+            ),
+            [-1],
+        )
 
     print_verbose("Fetching balance")
     your_balance = await subtensor.get_balance(wallet.coldkeypub.ss58_address)
@@ -215,17 +220,24 @@ async def subnets_list(
     """List all subnet netuids in the network."""
 
     async def fetch_subnet_data():
-        block_number_ = await subtensor.substrate.get_block_number(None)
-        subnets_ = await subtensor.all_subnets()
+        block_number_, subnets_ = await asyncio.gather(
+            subtensor.substrate.get_block_number(None), subtensor.all_subnets()
+        )
 
         # Sort subnets by market cap, keeping the root subnet in the first position
-        root_subnet = next(s for s in subnets_ if s.netuid == 0)
-        other_subnets = sorted(
-            [s for s in subnets_ if s.netuid != 0],
-            key=lambda x: (x.alpha_in.tao + x.alpha_out.tao) * x.price.tao,
-            reverse=True,
-        )
-        sorted_subnets = [root_subnet] + other_subnets
+        root_subnet = None
+        by_market_cap = []
+        for subnet in subnets_:
+            if subnet.netuid == 0:
+                root_subnet = subnet
+            else:
+                market_cap = (
+                    subnet.alpha_in.tao + subnet.alpha_out.tao
+                ) * subnet.price.tao
+                by_market_cap.append((market_cap, subnet))
+        by_market_cap.sort(key=itemgetter(0), reverse=True)
+        sorted_subnets = [root_subnet]
+        sorted_subnets.extend(map(itemgetter(1), by_market_cap))
         return sorted_subnets, block_number_
 
     def calculate_emission_stats(
@@ -254,6 +266,8 @@ async def subnets_list(
         total_netuids: int,
         tao_emission_percentage: str,
     ):
+        unit_tao = Balance.get_unit(0)
+        unit_alpha = Balance.get_unit(1)
         defined_table = Table(
             title=f"\n[{COLOR_PALETTE['GENERAL']['HEADER']}]Subnets"
             f"\nNetwork: [{COLOR_PALETTE['GENERAL']['SUBHEADING']}]{subtensor.network}\n\n",
@@ -275,35 +289,35 @@ async def subnets_list(
         )
         defined_table.add_column("[bold white]Name", style="cyan", justify="left")
         defined_table.add_column(
-            f"[bold white]Price \n({Balance.get_unit(0)}_in/{Balance.get_unit(1)}_in)",
+            f"[bold white]Price \n({unit_tao}_in/{unit_alpha}_in)",
             style="dark_sea_green2",
             justify="left",
             footer=f"τ {total_rate}",
         )
         defined_table.add_column(
-            f"[bold white]Market Cap \n({Balance.get_unit(1)} * Price)",
+            f"[bold white]Market Cap \n({unit_alpha} * Price)",
             style="steel_blue3",
             justify="left",
         )
         defined_table.add_column(
-            f"[bold white]Emission ({Balance.get_unit(0)})",
+            f"[bold white]Emission ({unit_tao})",
             style=COLOR_PALETTE["POOLS"]["EMISSION"],
             justify="left",
             footer=f"τ {total_emissions}",
         )
         defined_table.add_column(
-            f"[bold white]P ({Balance.get_unit(0)}_in, {Balance.get_unit(1)}_in)",
+            f"[bold white]P ({unit_tao}_in, {unit_alpha}_in)",
             style=COLOR_PALETTE["STAKE"]["TAO"],
             justify="left",
             footer=f"{tao_emission_percentage}",
         )
         defined_table.add_column(
-            f"[bold white]Stake ({Balance.get_unit(1)}_out)",
+            f"[bold white]Stake ({unit_alpha}_out)",
             style=COLOR_PALETTE["STAKE"]["STAKE_ALPHA"],
             justify="left",
         )
         defined_table.add_column(
-            f"[bold white]Supply ({Balance.get_unit(1)})",
+            f"[bold white]Supply ({unit_alpha})",
             style=COLOR_PALETTE["POOLS"]["ALPHA_IN"],
             justify="left",
         )
@@ -892,7 +906,7 @@ async def show(
             )
             return
 
-        tao_sum = sum(root_state.tao_stake).tao
+        tao_sum = Balance.from_rao(root_state.tao_stake_rao.sum()).tao
 
         table = Table(
             title=f"[{COLOR_PALETTE.G.HEADER}]Root Network\n[{COLOR_PALETTE.G.SUBHEAD}]"
@@ -936,23 +950,36 @@ async def show(
             justify="left",
         )
 
+        tao_stakes_rao = root_state.tao_stake_rao.tolist()
         sorted_hotkeys = sorted(
             enumerate(root_state.hotkeys),
-            key=lambda x: root_state.tao_stake[x[0]],
+            key=lambda x: tao_stakes_rao[x[0]],
             reverse=True,
         )
+        # Per-block TAO emission of every hotkey, summed across all subnets (in rao)
+        num_subnets = len(all_subnets)
+        emission_history = np.asarray(
+            root_state.emission_history[:num_subnets], dtype=np.float64
+        )
+        if emission_history.shape != (num_subnets, len(root_state.hotkeys)):
+            raise ValueError(
+                f"Root emission history has shape {emission_history.shape}, expected "
+                f"{(num_subnets, len(root_state.hotkeys))} (subnets, root hotkeys)"
+            )
+        tempos = np.array(
+            [subnet.tempo or 1 for subnet in all_subnets], dtype=np.float64
+        )
+        prices = np.array(
+            [subnet.price.tao for subnet in all_subnets], dtype=np.float64
+        )
+        emission_per_block_rao = (
+            emission_history * (prices / tempos)[:, np.newaxis]
+        ).sum(axis=0)
+
         sorted_rows = []
         sorted_hks_delegation = []
         for pos, (idx, hk) in enumerate(sorted_hotkeys):
-            total_emission_per_block = 0
-            for netuid_ in range(len(all_subnets)):
-                subnet = all_subnets[netuid_]
-                emission_on_subnet = root_state.emission_history[netuid_][idx] / (
-                    subnet.tempo or 1
-                )
-                total_emission_per_block += subnet.alpha_to_tao(
-                    Balance.from_rao(emission_on_subnet)
-                )
+            total_emission_per_block = Balance.from_rao(emission_per_block_rao[idx])
 
             # Get identity for this validator
             coldkey_identity = identities.get(root_state.coldkeys[idx], {}).get(
@@ -1121,33 +1148,14 @@ async def show(
         )
 
         # For table footers
-        alpha_sum = sum(
-            [
-                subnet_state.alpha_stake[idx].tao
-                for idx in range(len(subnet_state.alpha_stake))
-            ]
-        )
-        stake_sum = sum(
-            [
-                subnet_state.total_stake[idx].tao
-                for idx in range(len(subnet_state.total_stake))
-            ]
-        )
-        tao_sum = sum(
-            [
-                subnet_state.tao_stake[idx].tao * TAO_WEIGHT
-                for idx in range(len(subnet_state.tao_stake))
-            ]
-        )
+        alpha_sum = Balance.from_rao(subnet_state.alpha_stake_rao.sum()).tao
+        stake_sum = Balance.from_rao(subnet_state.total_stake_rao.sum()).tao
+        tao_sum = Balance.from_rao(subnet_state.tao_stake_rao.sum()).tao * TAO_WEIGHT
         dividends_sum = sum(
             subnet_state.dividends[idx] for idx in range(len(subnet_state.dividends))
         )
-        emission_sum = sum(
-            [
-                subnet_state.emission[idx].tao
-                for idx in range(len(subnet_state.emission))
-            ]
-        )
+        emissions_tao = subnet_state.emission_rao / 1e9
+        emission_sum = float(emissions_tao.sum())
 
         owner_hotkeys = await subtensor.get_owned_hotkeys(subnet_info.owner_coldkey)
         if subnet_info.owner_hotkey not in owner_hotkeys:
@@ -1161,6 +1169,18 @@ async def show(
                     owner_identity = hotkey_identity.display
                     break
 
+        sym = subnet_info.symbol
+        unit_alpha = Balance.get_unit(netuid_)
+
+        # Per-UID columns in tao, converted once rather than boxed per row
+        total_stakes_rao = subnet_state.total_stake_rao.tolist()
+        total_stakes_tao = (subnet_state.total_stake_rao / 1e9).tolist()
+        alpha_stakes_tao = (subnet_state.alpha_stake_rao / 1e9).tolist()
+        # TAO_WEIGHT applied in rao and truncated, as Balance multiplication does
+        tao_stakes_tao = (
+            (subnet_state.tao_stake_rao * TAO_WEIGHT).astype(np.int64) / 1e9
+        ).tolist()
+        emissions = emissions_tao.tolist()
         sorted_indices = sorted(
             range(len(subnet_state.hotkeys)),
             key=lambda i: (
@@ -1175,7 +1195,7 @@ async def show(
                         or subnet_state.hotkeys[i] in owner_hotkeys
                     ),
                     # Then sort by stake amount (higher stakes first)
-                    -subnet_state.total_stake[i].tao,
+                    -total_stakes_rao[i],
                 )
             ),
         )
@@ -1207,23 +1227,21 @@ async def show(
                         f"[dark_sea_green3]{uid_identity} (*Owner)[/dark_sea_green3]"
                     )
 
-            # Modify tao stake with TAO_WEIGHT
-            tao_stake = subnet_state.tao_stake[idx] * TAO_WEIGHT
             rows.append(
                 (
                     str(idx),  # UID
-                    f"{subnet_state.total_stake[idx].tao:.4f} {subnet_info.symbol}"
+                    f"{total_stakes_tao[idx]:.4f} {sym}"
                     if verbose
-                    else f"{millify_tao(subnet_state.total_stake[idx])} {subnet_info.symbol}",  # Stake
-                    f"{subnet_state.alpha_stake[idx].tao:.4f} {subnet_info.symbol}"
+                    else f"{millify_tao(total_stakes_tao[idx])} {sym}",  # Stake
+                    f"{alpha_stakes_tao[idx]:.4f} {sym}"
                     if verbose
-                    else f"{millify_tao(subnet_state.alpha_stake[idx])} {subnet_info.symbol}",  # Alpha Stake
-                    f"τ {tao_stake.tao:.4f}"
+                    else f"{millify_tao(alpha_stakes_tao[idx])} {sym}",  # Alpha Stake
+                    f"τ {tao_stakes_tao[idx]:.4f}"
                     if verbose
-                    else f"τ {millify_tao(tao_stake)}",  # Tao Stake
+                    else f"τ {millify_tao(tao_stakes_tao[idx])}",  # Tao Stake
                     f"{subnet_state.dividends[idx]:.6f}",  # Dividends
                     f"{subnet_state.incentives[idx]:.6f}",  # Incentive
-                    f"{Balance.from_tao(subnet_state.emission[idx].tao).set_unit(netuid_).tao:.6f} {subnet_info.symbol}",  # Emissions
+                    f"{emissions[idx]:.6f} {sym}",  # Emissions
                     f"{subnet_state.hotkeys[idx][:6]}"
                     if not verbose
                     else f"{subnet_state.hotkeys[idx]}",  # Hotkey
@@ -1236,14 +1254,12 @@ async def show(
             json_out_rows.append(
                 {
                     "uid": idx,
-                    "stake": subnet_state.total_stake[idx].tao,
-                    "alpha_stake": subnet_state.alpha_stake[idx].tao,
-                    "tao_stake": tao_stake.tao,
+                    "stake": total_stakes_tao[idx],
+                    "alpha_stake": alpha_stakes_tao[idx],
+                    "tao_stake": tao_stakes_tao[idx],
                     "dividends": subnet_state.dividends[idx],
                     "incentive": subnet_state.incentives[idx],
-                    "emissions": Balance.from_tao(subnet_state.emission[idx].tao)
-                    .set_unit(netuid_)
-                    .tao,
+                    "emissions": emissions[idx],
                     "hotkey": subnet_state.hotkeys[idx],
                     "coldkey": subnet_state.coldkeys[idx],
                     "identity": uid_identity,
@@ -1253,31 +1269,31 @@ async def show(
         # Add columns to the table
         table.add_column("UID", style="grey89", no_wrap=True, justify="center")
         table.add_column(
-            f"Stake ({Balance.get_unit(netuid_)})",
+            f"Stake ({unit_alpha})",
             style=COLOR_PALETTE["POOLS"]["ALPHA_IN"],
             no_wrap=True,
             justify="right",
-            footer=f"{stake_sum:.4f} {subnet_info.symbol}"
+            footer=f"{stake_sum:.4f} {sym}"
             if verbose
-            else f"{millify_tao(stake_sum)} {subnet_info.symbol}",
+            else f"{millify_tao(stake_sum)} {sym}",
         )
         table.add_column(
-            f"Alpha ({Balance.get_unit(netuid_)})",
+            f"Alpha ({unit_alpha})",
             style=COLOR_PALETTE["POOLS"]["EXTRA_2"],
             no_wrap=True,
             justify="right",
-            footer=f"{alpha_sum:.4f} {subnet_info.symbol}"
+            footer=f"{alpha_sum:.4f} {sym}"
             if verbose
-            else f"{millify_tao(alpha_sum)} {subnet_info.symbol}",
+            else f"{millify_tao(alpha_sum)} {sym}",
         )
         table.add_column(
             "Tao (τ)",
             style=COLOR_PALETTE["POOLS"]["EXTRA_2"],
             no_wrap=True,
             justify="right",
-            footer=f"{tao_sum:.4f} {subnet_info.symbol}"
+            footer=f"{tao_sum:.4f} {sym}"
             if verbose
-            else f"{millify_tao(tao_sum)} {subnet_info.symbol}",
+            else f"{millify_tao(tao_sum)} {sym}",
         )
         table.add_column(
             "Dividends",
@@ -1288,7 +1304,7 @@ async def show(
         )
         table.add_column("Incentive", style="#5fd7ff", no_wrap=True, justify="center")
         table.add_column(
-            f"Emissions ({Balance.get_unit(netuid_)})",
+            f"Emissions ({unit_alpha})",
             style=COLOR_PALETTE["POOLS"]["EMISSION"],
             no_wrap=True,
             justify="center",
@@ -1565,10 +1581,17 @@ async def register(
 ):
     """Register neuron by recycling some TAO."""
 
-    # Verify subnet exists
-    print_verbose("Checking subnet status")
+    # Verify subnet exists and check current recycle amount
+    print_verbose("Checking subnet status and fetching recycle amount")
     block_hash = await subtensor.substrate.get_chain_head()
-    if not await subtensor.subnet_exists(netuid=netuid, block_hash=block_hash):
+    exists, current_recycle_, balance = await asyncio.gather(
+        subtensor.subnet_exists(netuid=netuid, block_hash=block_hash),
+        subtensor.get_hyperparameter(
+            param_name="Burn", netuid=netuid, block_hash=block_hash
+        ),
+        subtensor.get_balance(wallet.coldkeypub.ss58_address, block_hash=block_hash),
+    )
+    if not exists:
         err_console.print(f"[red]Subnet {netuid} does not exist[/red]")
         if json_output:
             json_console.print(
@@ -1577,15 +1600,6 @@ async def register(
                 )
             )
         return
-
-    # Check current recycle amount
-    print_verbose("Fetching recycle amount")
-    current_recycle_, balance = await asyncio.gather(
-        subtensor.get_hyperparameter(
-            param_name="Burn", netuid=netuid, block_hash=block_hash
-        ),
-        subtensor.get_balance(wallet.coldkeypub.ss58_address, block_hash=block_hash),
-    )
     current_recycle = (
         Balance.from_rao(int(current_recycle_)) if current_recycle_ else Balance(0)
     )
@@ -1675,6 +1689,177 @@ async def register(
             err_console.print(f"Failure: {msg}")
 
 
+# Display spec of the metagraph table columns, in the order of the DB row:
+# (config key, header, footer, Column kwargs). Headers are formatted with the
+# subnet's unit and footers with the metagraph metadata on each render; headers
+# are styled as Text so no markup needs parsing when the columns are built.
+_METAGRAPH_COLUMNS: tuple[tuple[str, str, str, dict], ...] = (
+    (
+        "UID",
+        "UID",
+        "[white]{total_neurons}[/white]",
+        {"style": "white", "justify": "right", "ratio": 0.75},
+    ),
+    (
+        "GLOBAL_STAKE",
+        "GLOBAL STAKE(\u03c4)",
+        "{total_global_stake}",
+        {"style": "bright_cyan", "justify": "right", "no_wrap": True, "ratio": 1.6},
+    ),
+    (
+        "LOCAL_STAKE",
+        "LOCAL STAKE({unit})",
+        "{total_local_stake}",
+        {"style": "bright_green", "justify": "right", "no_wrap": True, "ratio": 1.5},
+    ),
+    (
+        "STAKE_WEIGHT",
+        "WEIGHT (\u03c4x{unit})",
+        "",
+        {"style": "purple", "justify": "right", "no_wrap": True, "ratio": 1.3},
+    ),
+    (
+        "RANK",
+        "RANK",
+        "{rank}",
+        {"style": "medium_purple", "justify": "right", "no_wrap": True, "ratio": 1},
+    ),
+    (
+        "TRUST",
+        "TRUST",
+        "{trust}",
+        {"style": "dark_sea_green", "justify": "right", "no_wrap": True, "ratio": 1},
+    ),
+    (
+        "CONSENSUS",
+        "CONSENSUS",
+        "{consensus}",
+        {"style": "rgb(42,161,152)", "justify": "right", "no_wrap": True, "ratio": 1},
+    ),
+    (
+        "INCENTIVE",
+        "INCENTIVE",
+        "{incentive}",
+        {"style": "#5fd7ff", "justify": "right", "no_wrap": True, "ratio": 1},
+    ),
+    (
+        "DIVIDENDS",
+        "DIVIDENDS",
+        "{dividends}",
+        {"style": "#8787d7", "justify": "right", "no_wrap": True, "ratio": 1},
+    ),
+    (
+        "EMISSION",
+        "EMISSION(\u03c1)",
+        "{emission}",
+        {"style": "#d7d7ff", "justify": "right", "no_wrap": True, "ratio": 1.5},
+    ),
+    (
+        "VTRUST",
+        "VTRUST",
+        "{validator_trust}",
+        {"style": "magenta", "justify": "right", "no_wrap": True, "ratio": 1},
+    ),
+    (
+        "VAL",
+        "VAL",
+        "",
+        {"style": "bright_white", "justify": "center", "no_wrap": True, "ratio": 0.7},
+    ),
+    (
+        "UPDATED",
+        "UPDATED",
+        "",
+        {"justify": "right", "no_wrap": True, "ratio": 1},
+    ),
+    (
+        "ACTIVE",
+        "ACTIVE",
+        "",
+        {"style": "#8787ff", "justify": "center", "no_wrap": True, "ratio": 1},
+    ),
+    (
+        "AXON",
+        "AXON",
+        "",
+        {"style": "dark_orange", "justify": "left", "overflow": "fold", "ratio": 2},
+    ),
+    (
+        "HOTKEY",
+        "HOTKEY",
+        "",
+        {
+            "style": "bright_magenta",
+            "justify": "center",
+            "overflow": "fold",
+            "ratio": 1.5,
+        },
+    ),
+    (
+        "COLDKEY",
+        "COLDKEY",
+        "",
+        {
+            "style": "bright_magenta",
+            "justify": "center",
+            "overflow": "fold",
+            "ratio": 1.5,
+        },
+    ),
+)
+
+
+def _format_metagraph_row(db_row: tuple) -> list[Text]:
+    """
+    Formats a row of the metagraph DB table into the cells displayed for it.
+
+    Cells are built as Text so the table renders them as-is, rather than running
+    markup and emoji processing on every cell each time it is measured and drawn.
+    """
+    (
+        uid,
+        global_stake,
+        local_stake,
+        stake_weight,
+        rank,
+        trust,
+        consensus,
+        incentive,
+        dividends,
+        emission,
+        validator_trust,
+        validator_permit,
+        updated,
+        active,
+        axon,
+        hotkey,
+        coldkey,
+    ) = db_row
+    return [
+        Text(str(uid)),
+        Text(f"{global_stake:.4f}"),
+        Text(f"{local_stake:.4f}"),
+        Text(f"{stake_weight:.4f}"),
+        Text(f"{rank:.5f}"),
+        Text(f"{trust:.5f}"),
+        Text(f"{consensus:.5f}"),
+        Text(f"{incentive:.5f}"),
+        Text(f"{dividends:.5f}"),
+        Text(str(emission)),
+        Text(f"{validator_trust:.5f}"),
+        Text("*" if validator_permit else ""),
+        Text(str(updated)),
+        Text(str(active)),
+        (
+            Text.assemble(("none", "light_goldenrod2"))
+            if axon == "ERROR"
+            else Text(axon)
+        ),
+        Text(hotkey),
+        Text(coldkey),
+    ]
+
+
 # TODO: Confirm emissions, incentive, Dividends are to be fetched from subnet_state or keep NeuronInfo
 async def metagraph_cmd(
     subtensor: Optional["SubtensorInterface"],
@@ -1695,17 +1880,15 @@ async def metagraph_cmd(
         ) as status:
             block_hash = await subtensor.substrate.get_chain_head()
 
-            if not await subtensor.subnet_exists(netuid, block_hash):
-                print_error(f"Subnet with netuid: {netuid} does not exist", status)
-                return False
-
             (
+                exists,
                 neurons,
                 difficulty_,
                 total_issuance_,
                 block,
                 subnet_state,
             ) = await asyncio.gather(
+                subtensor.subnet_exists(netuid, block_hash),
                 subtensor.neurons(netuid, block_hash=block_hash),
                 subtensor.get_hyperparameter(
                     param_name="Difficulty", netuid=netuid, block_hash=block_hash
@@ -1717,8 +1900,11 @@ async def metagraph_cmd(
                     block_hash=block_hash,
                 ),
                 subtensor.substrate.get_block_number(block_hash=block_hash),
-                subtensor.get_subnet_state(netuid=netuid),
+                subtensor.get_subnet_state(netuid=netuid, block_hash=block_hash),
             )
+            if not exists:
+                print_error(f"Subnet with netuid: {netuid} does not exist", status)
+                return False
 
         difficulty = int(difficulty_)
         total_issuance = Balance.from_rao(total_issuance_)
@@ -1729,77 +1915,49 @@ async def metagraph_cmd(
             subnet_state=subnet_state,
             block=block,
         )
-        table_data = []
-        db_table = []
-        total_global_stake = 0.0
-        total_local_stake = 0.0
-        total_rank = 0.0
-        total_validator_trust = 0.0
-        total_trust = 0.0
-        total_consensus = 0.0
-        total_incentive = 0.0
-        total_dividends = 0.0
-        total_emission = 0
-        for uid in metagraph.uids:
-            neuron = metagraph.neurons[uid]
-            ep = metagraph.axons[uid]
-            row = [
-                str(neuron.uid),
-                "{:.4f}".format(metagraph.global_stake[uid]),
-                "{:.4f}".format(metagraph.local_stake[uid]),
-                "{:.4f}".format(metagraph.stake_weights[uid]),
-                "{:.5f}".format(metagraph.ranks[uid]),
-                "{:.5f}".format(metagraph.trust[uid]),
-                "{:.5f}".format(metagraph.consensus[uid]),
-                "{:.5f}".format(metagraph.incentive[uid]),
-                "{:.5f}".format(metagraph.dividends[uid]),
-                "{}".format(int(metagraph.emission[uid] * 1000000000)),
-                "{:.5f}".format(metagraph.validator_trust[uid]),
-                "*" if metagraph.validator_permit[uid] else "",
-                str(metagraph.block.item() - metagraph.last_update[uid].item()),
-                str(metagraph.active[uid].item()),
-                (
-                    ep.ip + ":" + str(ep.port)
-                    if ep.is_serving
-                    else "[light_goldenrod2]none[/light_goldenrod2]"
-                ),
-                ep.hotkey[:10],
-                ep.coldkey[:10],
-            ]
-            db_row = [
-                neuron.uid,
-                float(metagraph.global_stake[uid]),
-                float(metagraph.local_stake[uid]),
-                float(metagraph.stake_weights[uid]),
-                float(metagraph.ranks[uid]),
-                float(metagraph.trust[uid]),
-                float(metagraph.consensus[uid]),
-                float(metagraph.incentive[uid]),
-                float(metagraph.dividends[uid]),
-                int(metagraph.emission[uid] * 1000000000),
-                float(metagraph.validator_trust[uid]),
-                bool(metagraph.validator_permit[uid]),
-                metagraph.block.item() - metagraph.last_update[uid].item(),
-                metagraph.active[uid].item(),
-                (ep.ip + ":" + str(ep.port) if ep.is_serving else "ERROR"),
-                ep.hotkey[:10],
-                ep.coldkey[:10],
-            ]
-            db_table.append(db_row)
-            total_global_stake += metagraph.global_stake[uid]
-            total_local_stake += metagraph.local_stake[uid]
-            total_rank += metagraph.ranks[uid]
-            total_validator_trust += metagraph.validator_trust[uid]
-            total_trust += metagraph.trust[uid]
-            total_consensus += metagraph.consensus[uid]
-            total_incentive += metagraph.incentive[uid]
-            total_dividends += metagraph.dividends[uid]
-            total_emission += int(metagraph.emission[uid] * 1000000000)
-            table_data.append(row)
+        # Convert every per-UID column to Python scalars in one pass each, then
+        # zip the columns into DB rows instead of assembling them cell by cell
+        emission_rao = (metagraph.emission * 1000000000).astype(np.int64)
+        db_table = list(
+            zip(
+                metagraph.uids.tolist(),
+                metagraph.global_stake.tolist(),
+                metagraph.local_stake.tolist(),
+                metagraph.stake_weights.tolist(),
+                metagraph.ranks.tolist(),
+                metagraph.trust.tolist(),
+                metagraph.consensus.tolist(),
+                metagraph.incentive.tolist(),
+                metagraph.dividends.tolist(),
+                emission_rao.tolist(),
+                metagraph.validator_trust.tolist(),
+                metagraph.validator_permit.tolist(),
+                (metagraph.block - metagraph.last_update).tolist(),
+                metagraph.active.tolist(),
+                [
+                    ep.ip + ":" + str(ep.port) if ep.is_serving else "ERROR"
+                    for ep in metagraph.axons
+                ],
+                [ep.hotkey[:10] for ep in metagraph.axons],
+                [ep.coldkey[:10] for ep in metagraph.axons],
+            )
+        )
+        # Column totals, reduced in float64 rather than accumulated per UID
+        total_global_stake = metagraph.global_stake.sum(dtype=np.float64)
+        total_local_stake = metagraph.local_stake.sum(dtype=np.float64)
+        total_rank = metagraph.ranks.sum(dtype=np.float64)
+        total_validator_trust = metagraph.validator_trust.sum(dtype=np.float64)
+        total_trust = metagraph.trust.sum(dtype=np.float64)
+        total_consensus = metagraph.consensus.sum(dtype=np.float64)
+        total_incentive = metagraph.incentive.sum(dtype=np.float64)
+        total_dividends = metagraph.dividends.sum(dtype=np.float64)
+        total_emission = int(emission_rao.sum())
+        unit_alpha = Balance.get_unit(netuid)
+        n = metagraph.n.item()
+        active_count = int(metagraph.active.sum())
         metadata_info = {
             "total_global_stake": "\u03c4 {:.5f}".format(total_global_stake),
-            "total_local_stake": f"{Balance.get_unit(netuid)} "
-            + "{:.5f}".format(total_local_stake),
+            "total_local_stake": f"{unit_alpha} " + "{:.5f}".format(total_local_stake),
             "rank": "{:.5f}".format(total_rank),
             "validator_trust": "{:.5f}".format(total_validator_trust),
             "trust": "{:.5f}".format(total_trust),
@@ -1808,21 +1966,20 @@ async def metagraph_cmd(
             "dividends": "{:.5f}".format(total_dividends),
             "emission": "\u03c1{}".format(int(total_emission)),
             "net": f"{subtensor.network}:{metagraph.netuid}",
-            "block": str(metagraph.block.item()),
-            "N": f"{sum(metagraph.active.tolist())}/{metagraph.n.item()}",
-            "N0": str(sum(metagraph.active.tolist())),
-            "N1": str(metagraph.n.item()),
+            "block": str(block),
+            "N": f"{active_count}/{n}",
+            "N0": str(active_count),
+            "N1": str(n),
             "issuance": str(total_issuance),
             "difficulty": str(difficulty),
             "total_neurons": str(len(metagraph.uids)),
-            "table_data": json.dumps(table_data),
         }
         if not no_cache:
             update_metadata_table("metagraph", metadata_info)
             create_table(
                 "metagraph",
                 columns=[
-                    ("UID", "INTEGER"),
+                    ("UID", "INTEGER PRIMARY KEY"),
                     ("GLOBAL_STAKE", "REAL"),
                     ("LOCAL_STAKE", "REAL"),
                     ("STAKE_WEIGHT", "REAL"),
@@ -1841,11 +1998,13 @@ async def metagraph_cmd(
                     ("COLDKEY", "TEXT"),
                 ],
                 rows=db_table,
+                without_rowid=True,
             )
     else:
         try:
             metadata_info = get_metadata_table("metagraph")
-            table_data = json.loads(metadata_info["table_data"])
+            _, db_table = read_table("metagraph")
+            unit_alpha = Balance.get_unit(int(metadata_info["net"].rsplit(":", 1)[1]))
         except sqlite3.OperationalError:
             err_console.print(
                 "[red]Error[/red] Unable to retrieve table data. This is usually caused by attempting to use "
@@ -1879,7 +2038,7 @@ async def metagraph_cmd(
                         "field": "LOCAL_STAKE",
                         "formatter": "money",
                         "formatterParams": {
-                            "symbol": f"{Balance.get_unit(netuid)}",
+                            "symbol": unit_alpha,
                             "precision": 5,
                         },
                     },
@@ -1942,179 +2101,17 @@ async def metagraph_cmd(
             return
     else:
         cols: dict[str, tuple[int, Column]] = {
-            "UID": (
-                0,
-                Column(
-                    "[bold white]UID",
-                    footer=f"[white]{metadata_info['total_neurons']}[/white]",
-                    style="white",
-                    justify="right",
-                    ratio=0.75,
-                ),
-            ),
-            "GLOBAL_STAKE": (
-                1,
-                Column(
-                    "[bold white]GLOBAL STAKE(\u03c4)",
-                    footer=metadata_info["total_global_stake"],
-                    style="bright_cyan",
-                    justify="right",
-                    no_wrap=True,
-                    ratio=1.6,
-                ),
-            ),
-            "LOCAL_STAKE": (
-                2,
-                Column(
-                    f"[bold white]LOCAL STAKE({Balance.get_unit(netuid)})",
-                    footer=metadata_info["total_local_stake"],
-                    style="bright_green",
-                    justify="right",
-                    no_wrap=True,
-                    ratio=1.5,
-                ),
-            ),
-            "STAKE_WEIGHT": (
-                3,
-                Column(
-                    f"[bold white]WEIGHT (\u03c4x{Balance.get_unit(netuid)})",
-                    style="purple",
-                    justify="right",
-                    no_wrap=True,
-                    ratio=1.3,
-                ),
-            ),
-            "RANK": (
-                4,
-                Column(
-                    "[bold white]RANK",
-                    footer=metadata_info["rank"],
-                    style="medium_purple",
-                    justify="right",
-                    no_wrap=True,
-                    ratio=1,
-                ),
-            ),
-            "TRUST": (
-                5,
-                Column(
-                    "[bold white]TRUST",
-                    footer=metadata_info["trust"],
-                    style="dark_sea_green",
-                    justify="right",
-                    no_wrap=True,
-                    ratio=1,
-                ),
-            ),
-            "CONSENSUS": (
-                6,
-                Column(
-                    "[bold white]CONSENSUS",
-                    footer=metadata_info["consensus"],
-                    style="rgb(42,161,152)",
-                    justify="right",
-                    no_wrap=True,
-                    ratio=1,
-                ),
-            ),
-            "INCENTIVE": (
-                7,
-                Column(
-                    "[bold white]INCENTIVE",
-                    footer=metadata_info["incentive"],
-                    style="#5fd7ff",
-                    justify="right",
-                    no_wrap=True,
-                    ratio=1,
-                ),
-            ),
-            "DIVIDENDS": (
-                8,
+            key: (
+                idx,
                 Column(
-                    "[bold white]DIVIDENDS",
-                    footer=metadata_info["dividends"],
-                    style="#8787d7",
-                    justify="right",
-                    no_wrap=True,
-                    ratio=1,
+                    Text.assemble((header.format(unit=unit_alpha), "bold white")),
+                    footer=footer.format_map(metadata_info),
+                    **column_kwargs,
                 ),
-            ),
-            "EMISSION": (
-                9,
-                Column(
-                    "[bold white]EMISSION(\u03c1)",
-                    footer=metadata_info["emission"],
-                    style="#d7d7ff",
-                    justify="right",
-                    no_wrap=True,
-                    ratio=1.5,
-                ),
-            ),
-            "VTRUST": (
-                10,
-                Column(
-                    "[bold white]VTRUST",
-                    footer=metadata_info["validator_trust"],
-                    style="magenta",
-                    justify="right",
-                    no_wrap=True,
-                    ratio=1,
-                ),
-            ),
-            "VAL": (
-                11,
-                Column(
-                    "[bold white]VAL",
-                    justify="center",
-                    style="bright_white",
-                    no_wrap=True,
-                    ratio=0.7,
-                ),
-            ),
-            "UPDATED": (
-                12,
-                Column("[bold white]UPDATED", justify="right", no_wrap=True, ratio=1),
-            ),
-            "ACTIVE": (
-                13,
-                Column(
-                    "[bold white]ACTIVE",
-                    justify="center",
-                    style="#8787ff",
-                    no_wrap=True,
-                    ratio=1,
-                ),
-            ),
-            "AXON": (
-                14,
-                Column(
-                    "[bold white]AXON",
-                    justify="left",
-                    style="dark_orange",
-                    overflow="fold",
-                    ratio=2,
-                ),
-            ),
-            "HOTKEY": (
-                15,
-                Column(
-                    "[bold white]HOTKEY",
-                    justify="center",
-                    style="bright_magenta",
-                    overflow="fold",
-                    ratio=1.5,
-                ),
-            ),
-            "COLDKEY": (
-                16,
-                Column(
-                    "[bold white]COLDKEY",
-                    justify="center",
-                    style="bright_magenta",
-                    overflow="fold",
-                    ratio=1.5,
-                ),
-            ),
+            )
+            for idx, (key, header, footer, column_kwargs) in enumerate(
+                _METAGRAPH_COLUMNS
+            )
         }
         table_cols: list[Column] = []
         table_cols_indices: list[int] = []
@@ -2146,6 +2143,8 @@ async def metagraph_cmd(
             pad_edge=True,
         )
 
+        # DB rows are formatted into cells only here, as they are rendered; the
+        # HTML output reads the cached table instead
         if all(x is False for x in display_cols.values()):
             console.print("You have selected no columns to display in your config.")
             table.add_row(" " * 256)  # allows title to be printed
@@ -2154,12 +2153,18 @@ async def metagraph_cmd(
                 "Limiting column display output based on your config settings. Hiding columns "
                 f"{', '.join([k for (k, v) in display_cols.items() if v is False])}"
             )
-            for row in table_data:
-                new_row = [row[idx] for idx in table_cols_indices]
-                table.add_row(*new_row)
+            if len(table_cols_indices) == 1:
+                (only_idx,) = table_cols_indices
+                for db_row in db_table:
+                    table.add_row(_format_metagraph_row(db_row)[only_idx])
+            else:
+                # itemgetter only returns a tuple when given several indices
+                pick_cols = itemgetter(*table_cols_indices)
+                for db_row in db_table:
+                    table.add_row(*pick_cols(_format_metagraph_row(db_row)))
         else:
-            for row in table_data:
-                table.add_row(*row)
+            for db_row in db_table:
+                table.add_row(*_format_metagraph_row(db_row))
 
         console.print(table)
 
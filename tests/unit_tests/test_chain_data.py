@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from bittensor_cli.src.bittensor.balances import Balance
+from bittensor_cli.src.bittensor.chain_data import SubnetState, _BalanceView
+
+
+def test_balance_view():
+    view = _BalanceView(np.array([1, 2_000_000_000, 3], dtype=np.int64), 5)
+
+    assert len(view) == 3
+    assert view[1] == Balance.from_tao(2)
+    assert view[-1].rao == 3
+    assert view[1].unit == Balance.get_unit(5)
+    assert isinstance(view[0].rao, int)
+    assert [b.rao for b in view] == [1, 2_000_000_000, 3]
+    assert [b.rao for b in view[1:]] == [2_000_000_000, 3]
+    with pytest.raises(IndexError):
+        view[3]
+
+
+def test_subnet_state_balances_match_decoded_rao():
+    netuid = 3
+    decoded = {
+        "netuid": netuid,
+        "hotkeys": [tuple([1] * 32), tuple([2] * 32)],
+        "coldkeys": [tuple([3] * 32), tuple([4] * 32)],
+        "active": [True, False],
+        "validator_permit": [True, False],
+        "pruning_score": [0, 65535],
+        "last_update": [10, 20],
+        "emission": [123_456_789, 0],
+        "dividends": [65535, 0],
+        "incentives": [0, 32768],
+        "consensus": [1, 2],
+        "trust": [3, 4],
+        "rank": [5, 6],
+        "block_at_registration": [1, 2],
+        "alpha_stake": [5_000_000_000, 7],
+        "tao_stake": [8, 9_000_000_000],
+        "total_stake": [10, 2**62],
+        "emission_history": [[1, 2]],
+    }
+
+    state = SubnetState.from_any(decoded)
+
+    # Same values as boxing each decoded rao amount into a Balance up front
+    for field, unit_netuid in (
+        ("emission", netuid),
+        ("alpha_stake", netuid),
+        ("tao_stake", 0),
+        ("total_stake", netuid),
+    ):
+        expected = [Balance.from_rao(v).set_unit(unit_netuid) for v in decoded[field]]
+        values = list(getattr(state, field))
+        assert [b.rao for b in values] == [b.rao for b in expected]
+        assert [b.unit for b in values] == [b.unit for b in expected]
+    assert state.dividends == [1.0, 0.0]
+    assert state.pruning_score == [0.0, 1.0]
@@ -0,0 +1,165 @@
+from itertools import chain, repeat
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from async_substrate_interface.errors import SubstrateRequestException
+
+from bittensor_cli.src.bittensor.balances import Balance
+from bittensor_cli.src.commands.stake.remove import (
+    _get_dynamic_subnet_prices,
+    _parse_netuids,
+    _submit_unstake_operations,
+)
+
+
+class FakeReceipt:
+    def __init__(self, extrinsic_hash: str):
+        self.extrinsic_hash = extrinsic_hash
+        self.block_hash = None
+
+    @property
+    async def is_success(self):
+        return True
+
+
+class FakeExtrinsic:
+    def __init__(self, nonce: int, era: dict):
+        self.nonce = nonce
+        self.era = era
+        self.extrinsic_hash = bytes([nonce])
+
+
+def mock_subtensor(chain_nonce, era_starts, submit_extrinsic, get_block):
+    """Mock subtensor whose finalized head is at `era_starts` while the operations are
+    signed, and at block 200 once their inclusion is awaited."""
+
+    async def create_signed_extrinsic(call, keypair, nonce, era):
+        return FakeExtrinsic(nonce, era)
+
+    substrate = MagicMock()
+    substrate.get_chain_finalised_head = AsyncMock(return_value="0xfinalized")
+    substrate.get_block_number = AsyncMock(side_effect=chain(era_starts, repeat(200)))
+    substrate.get_account_next_index = AsyncMock(return_value=chain_nonce)
+    substrate.compose_call = AsyncMock()
+    substrate.create_signed_extrinsic = create_signed_extrinsic
+    substrate.submit_extrinsic = submit_extrinsic
+    substrate.get_block_hash = AsyncMock(side_effect=lambda n: f"0x{n}")
+    substrate.get_block = get_block
+    subtensor = MagicMock()
+    subtensor.substrate = substrate
+    return subtensor
+
+
+def unstake_operations(*netuids):
+    return [
+        {
+            "netuid": netuid,
+            "hotkey_ss58": "5Hotkey",
+            "amount_to_unstake": Balance.from_tao(1),
+            "price_with_tolerance": Balance.from_tao(1).rao,
+        }
+        for netuid in netuids
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rejected_unstake_does_not_fail_later_operations():
+    wallet = MagicMock()
+    wallet.coldkeypub.ss58_address = "5Coldkey"
+    chain_nonce = 7
+
+    async def submit_extrinsic(extrinsic, wait_for_inclusion, wait_for_finalization):
+        # The pool rejects the first operation, so its nonce is never used
+        if not submitted:
+            submitted.append(None)
+            raise SubstrateRequestException("Custom error: 8")
+        submitted.append(extrinsic)
+        return FakeReceipt(f"0x{extrinsic.extrinsic_hash.hex()}")
+
+    async def get_block(block_hash):
+        return {"extrinsics": [None, *(e for e in submitted if e is not None)]}
+
+    submitted = []
+    subtensor = mock_subtensor(
+        chain_nonce, [100, 100, 100], submit_extrinsic, get_block
+    )
+    results = await _submit_unstake_operations(
+        wallet=wallet,
+        subtensor=subtensor,
+        unstake_operations=unstake_operations(1, 2, 3),
+        safe_staking=True,
+        allow_partial_stake=False,
+        block_hash="0xhead",
+    )
+
+    assert results == [False, True, True]
+    # The operations after the rejected one take over its nonce, leaving no gap
+    assert [e.nonce for e in submitted if e is not None] == [
+        chain_nonce,
+        chain_nonce + 1,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unstake_waits_for_each_operations_own_era():
+    wallet = MagicMock()
+    wallet.coldkeypub.ss58_address = "5Coldkey"
+
+    async def submit_extrinsic(extrinsic, wait_for_inclusion, wait_for_finalization):
+        submitted.append(extrinsic)
+        return FakeReceipt(f"0x{extrinsic.extrinsic_hash.hex()}")
+
+    async def get_block(block_hash):
+        # The first operation lands inside its era of 100-104, the second in block 106,
+        # after the first operation's era but inside its own era of 103-107
+        landed_at = {"0x102": submitted[:1], "0x106": submitted[1:]}
+        return {"extrinsics": landed_at.get(block_hash, [])}
+
+    submitted = []
+    subtensor = mock_subtensor(0, [100, 103], submit_extrinsic, get_block)
+    results = await _submit_unstake_operations(
+        wallet=wallet,
+        subtensor=subtensor,
+        unstake_operations=unstake_operations(1, 2),
+        safe_staking=False,
+        allow_partial_stake=False,
+        era=3,
+    )
+
+    assert results == [True, True]
+    assert [e.era for e in submitted] == [
+        {"period": 3, "current": 100},
+        {"period": 3, "current": 103},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_dynamic_subnet_prices_skip_root():
+    subtensor = MagicMock()
+    subtensor.get_all_subnet_netuids = AsyncMock(return_value=[0, 1, 4])
+    subtensor.get_subnet_prices = AsyncMock(return_value={1: Balance.from_tao(2)})
+
+    prices = await _get_dynamic_subnet_prices(subtensor, block_hash="0xhead")
+
+    assert prices == {1: Balance.from_tao(2)}
+    subtensor.get_subnet_prices.assert_awaited_once_with(1, 4, block_hash="0xhead")
+
+
+@pytest.mark.parametrize(
+    "netuid_input",
+    ["1,2,3", " 1 , 2,3 ", "4,1,4", "7", "0, 9 ,2"],
+)
+def test_parse_netuids(netuid_input):
+    valid_netuids = {0, 1, 2, 3}
+    netuid_list = [int(n) for n in netuid_input.split(",")]
+
+    assert _parse_netuids(netuid_input, valid_netuids) == (
+        netuid_list,
+        [n for n in netuid_list if n not in valid_netuids],
+    )
+
+
+@pytest.mark.parametrize("netuid_input", ["", "1,,2", "1,a", "1.5", "1;2"])
+def test_parse_netuids_rejects_non_integers(netuid_input):
+    with pytest.raises(ValueError):
+        _parse_netuids(netuid_input, {1, 2})
@@ -0,0 +1,115 @@
+from functools import partial
+
+from bittensor_cli.src.bittensor import utils
+from bittensor_cli.src.bittensor.utils import create_table, read_table
+from bittensor_cli.src.commands.subnets.subnets import _format_metagraph_row
+
+METAGRAPH_COLUMNS = [
+    ("UID", "INTEGER PRIMARY KEY"),
+    ("GLOBAL_STAKE", "REAL"),
+    ("LOCAL_STAKE", "REAL"),
+    ("STAKE_WEIGHT", "REAL"),
+    ("RANK", "REAL"),
+    ("TRUST", "REAL"),
+    ("CONSENSUS", "REAL"),
+    ("INCENTIVE", "REAL"),
+    ("DIVIDENDS", "REAL"),
+    ("EMISSION", "INTEGER"),
+    ("VTRUST", "REAL"),
+    ("VAL", "INTEGER"),
+    ("UPDATED", "INTEGER"),
+    ("ACTIVE", "INTEGER"),
+    ("AXON", "TEXT"),
+    ("HOTKEY", "TEXT"),
+    ("COLDKEY", "TEXT"),
+]
+
+
+def test_metagraph_table_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, "DB", partial(utils.DB, db_path=str(tmp_path / "t.db")))
+    rows = [
+        (
+            1,
+            12.5,
+            3.25,
+            0.5,
+            0.125,
+            0.25,
+            0.375,
+            0.0625,
+            0.03125,
+            1500000000,
+            0.75,
+            True,
+            7,
+            1,
+            "ERROR",
+            "5HotkeyB12",
+            "5ColdkeyB1",
+        ),
+        (
+            0,
+            100.0,
+            42.0,
+            1.0,
+            0.5,
+            0.5,
+            0.5,
+            0.5,
+            0.5,
+            0,
+            1.0,
+            False,
+            0,
+            0,
+            "1.2.3.4:8091",
+            "5HotkeyA12",
+            "5ColdkeyA1",
+        ),
+    ]
+
+    create_table("metagraph", METAGRAPH_COLUMNS, rows, without_rowid=True)
+    column_names, db_table = read_table("metagraph")
+
+    assert column_names == [name for name, _ in METAGRAPH_COLUMNS]
+    # Rows come back in UID order, with booleans stored as integers
+    assert [row[0] for row in db_table] == [0, 1]
+    assert db_table[1] == tuple(int(v) if v is True else v for v in rows[0])
+    assert [type(v) for v in db_table[0]] == [
+        int,
+        *[float] * 8,
+        int,
+        float,
+        int,
+        int,
+        int,
+        str,
+        str,
+        str,
+    ]
+
+    serving, not_serving = (
+        [cell.plain for cell in _format_metagraph_row(row)] for row in db_table
+    )
+    assert serving == [
+        "0",
+        "100.0000",
+        "42.0000",
+        "1.0000",
+        "0.50000",
+        "0.50000",
+        "0.50000",
+        "0.50000",
+        "0.50000",
+        "0",
+        "1.00000",
+        "",
+        "0",
+        "0",
+        "1.2.3.4:8091",
+        "5HotkeyA12",
+        "5ColdkeyA1",
+    ]
+    assert not_serving[11] == "*"
+    assert not_serving[14] == "none"
+    assert _format_metagraph_row(db_table[1])[14].spans[0].style == "light_goldenrod2"
@@ -0,0 +1,33 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bittensor_cli.src.bittensor.balances import Balance
+from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+
+
+@pytest.mark.asyncio
+async def test_get_subnet_prices_skips_unset_prices():
+    def storage_key(netuid):
+        key = MagicMock()
+        key.params = [netuid]
+        return key
+
+    subtensor = SubtensorInterface("finney")
+    subtensor.substrate = MagicMock()
+    subtensor.substrate.create_storage_key = AsyncMock(
+        side_effect=lambda module, storage, params, block_hash: storage_key(params[0])
+    )
+    subtensor.substrate.query_multi = AsyncMock(
+        side_effect=lambda calls, block_hash: [
+            # Root has no AlphaSqrtPrice entry
+            (calls[0], None),
+            # sqrt price of 2.0 as a U64F64
+            (calls[1], {"bits": 2 << 64}),
+            (calls[2], {}),
+        ]
+    )
+
+    prices = await subtensor.get_subnet_prices(0, 1, 2, block_hash="0xblock")
+
+    assert prices == {1: Balance.from_tao(4)}